@@ -309,6 +309,7 @@ def scan_active() -> Dict[str, object]:
     year = payload.get("year")
     month = payload.get("month")
     deep_read = payload.get("deep_read", True)
+    include_body = payload.get("include_body", True)
 
     if not VAMP_AGENT_ENABLED:
         return {"status": "error", "error": "VAMP agent disabled (set VAMP_AGENT_ENABLED=1 to enable)"}, 503
@@ -332,6 +333,7 @@ def scan_active() -> Dict[str, object]:
                 month=month,
                 url=url,
                 deep_read=deep_read,
+                include_body=include_body,
                 progress_callback=None,
             )
         )
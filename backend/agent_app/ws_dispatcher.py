@@ -215,6 +215,10 @@ _CONNECTOR_SPEC = {
             "year": "Optional. Defaults to the provided payload year or current year.",
             "month": "Optional. Defaults to the provided payload month or current month.",
             "deep_read": "Optional boolean. When false, skips deep content extraction (defaults to true).",
+            "include_body": (
+                "Optional boolean. When false, Outlook scans return list metadata only "
+                "without opening messages (defaults to true)."
+            ),
         },
     }
 }
@@ -526,6 +530,7 @@ class WSActionDispatcher:
         month = self._resolve_month(sid, msg)
         url = (msg.get("url") or "https://outlook.office365.com/mail/").strip()
         deep_read = bool(msg.get("deep_read", True))
+        include_body = bool(msg.get("include_body", True))
 
         logger.info("Starting scan for %s %d-%02d", uid, year, month)
         context_snapshot = dict(msg)
@@ -558,6 +563,7 @@ class WSActionDispatcher:
                 brain_msg.setdefault("month", month)
                 brain_msg.setdefault("url", url)
                 brain_msg.setdefault("deep_read", deep_read)
+                brain_msg.setdefault("include_body", include_body)
                 orchestrated = await _orchestrate_answer(
                     brain_msg,
                     autop_prompt,
@@ -624,6 +630,7 @@ class WSActionDispatcher:
                 month=month,
                 url=url,
                 deep_read=deep_read,
+                include_body=include_body,
                 progress_callback=on_progress,
             )
 
@@ -903,6 +910,13 @@ async def _execute_action(
         deep_read = bool(base_msg.get("deep_read", True))
     else:
         deep_read = bool(deep_read)
+    include_body = args.get("include_body")
+    if isinstance(include_body, str):
+        include_body = include_body.lower() not in {"0", "false", "no"}
+    elif include_body is None:
+        include_body = bool(base_msg.get("include_body", True))
+    else:
+        include_body = bool(include_body)
 
     if not url:
         observation["error"] = "URL is required for scan_active"
@@ -926,6 +940,7 @@ async def _execute_action(
             month=month,
             url=url,
             deep_read=bool(deep_read),
+            include_body=bool(include_body),
             progress_callback=capture_progress,
         )
     except Exception as exc:  # pragma: no cover
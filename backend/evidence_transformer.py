@@ -14,12 +14,112 @@ This module handles:
 """
 
 from __future__ import annotations
+import array
 import json
 import hashlib
-from typing import Any, Dict, List, Optional, Tuple, Set
+import heapq
+import operator
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Tuple, Set
 from pathlib import Path
 from datetime import datetime
 
+# Fields that identify an evidence item across platforms for deduplication.
+KEY_FIELDS: Tuple[str, ...] = ("source", "path", "hash", "title", "timestamp")
+
+# Below this many items the process pool start-up costs more than it saves.
+PARALLEL_THRESHOLD = 512
+
+
+def _dedupe_keywords(keywords: List[str]) -> List[str]:
+    """Drop repeated keywords (case-insensitive), keeping first occurrence order."""
+    seen: Set[str] = set()
+    return [k for k in keywords if not (k.lower() in seen or seen.add(k.lower()))]
+
+
+def _trie_regex(keywords: List[str]) -> str:
+    """Render keywords as a prefix-trie alternation (``ab|ac`` -> ``a(?:b|c)``).
+
+    ``re`` tries alternation branches one by one, so a flat ``kw1|kw2|...``
+    is slower than N substring checks; sharing prefixes lets each position
+    fail after a single character comparison.
+    """
+    trie: Dict[str, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Optional tails are greedy, so the longest keyword at a position wins
+        return f"(?:{body})?" if "" in node else body
+
+    return render(trie)
+
+
+def _compile_keywords(
+    keywords: Iterable[str],
+) -> Tuple[Optional[Pattern[str]], Dict[str, Tuple[str, ...]]]:
+    """Compile lowercase keywords into one overlapping-match regex.
+
+    The pattern reports the longest keyword starting at each position. The
+    returned expansion map lists, per keyword, every keyword that is a prefix
+    of it, so expanding the matches yields exactly the keywords ``in`` text.
+    """
+    unique = sorted({k for k in keywords if k})
+    if not unique:
+        return None, {}
+    pattern = re.compile(f"(?=({_trie_regex(unique)}))")
+    expansions = {k: tuple(p for p in unique if k.startswith(p)) for k in unique}
+    return pattern, expansions
+
+
+def _find_keywords(
+    pattern: Optional[Pattern[str]], expansions: Dict[str, Tuple[str, ...]], text: str
+) -> Set[str]:
+    """Return every compiled keyword that occurs in ``text`` in one C-level scan."""
+    found: Set[str] = set()
+    if pattern is not None:
+        for match in pattern.finditer(text):
+            found.update(expansions[match.group(1)])
+    return found
+
+
+def _hash_key(item_hash: str) -> int:
+    """Map a hash string onto the 64-bit integer space used by ``seen_hashes``.
+
+    Our own 16-hex-digit hashes round-trip exactly; other caller-supplied
+    hashes (e.g. SHA-1 hex) are folded down with BLAKE2b.
+    """
+    if len(item_hash) == 16:
+        try:
+            return int(item_hash, 16)
+        except ValueError:
+            pass
+    return int.from_bytes(hashlib.blake2b(item_hash.encode(), digest_size=8).digest(), "big")
+
+
+# Per-process transformer used by ``batch_transform`` pool workers.
+_WORKER_TX: Optional["EvidenceTransformer"] = None
+
+
+def _init_worker(transformer: "EvidenceTransformer") -> None:
+    global _WORKER_TX
+    _WORKER_TX = transformer
+    _WORKER_TX.seen_hashes = set()
+
+
+def _worker_transform_chunk(items: List[Dict[str, Any]], timestamp: str) -> List[Dict[str, Any]]:
+    return [_WORKER_TX.transform(item, timestamp=timestamp) for item in items]
+
 
 class EvidenceTransformer:
     """Transform raw VAMP evidence into scored, tiered, policy-checked form."""
@@ -29,12 +129,18 @@ class EvidenceTransformer:
         kpa_config_path: Optional[str] = None,
         tier_keywords_path: Optional[str] = None,
         policy_registry_path: Optional[str] = None,
+        top_k: int = 5,
     ):
-        """Initialize transformer with configuration files."""
+        """Initialize transformer with configuration files.
+
+        ``top_k`` caps how many KPAs are kept per item (``kpa``/``kpa_scores``);
+        raise it to the number of configured KPAs to keep every match.
+        """
+        self.top_k = top_k
         self.kpa_keywords: Dict[str, List[Tuple[str, float]]] = {}
         self.tier_keywords: Dict[str, List[str]] = {}
         self.policy_registry: Dict[str, Dict] = {}
-        self.seen_hashes: Set[str] = set()
+        self.seen_hashes: Set[int] = set()
 
         # Load KPA configuration
         if kpa_config_path and Path(kpa_config_path).exists():
@@ -43,6 +149,8 @@ class EvidenceTransformer:
                     config = json.load(f)
                     for kpa, keywords in config.items():
                         # keywords can be list of strings (importance 1.0) or list of [keyword, importance]
+                        # Kept as configured: repeats count towards the KPA score,
+                        # and the matcher already probes each keyword once
                         self.kpa_keywords[kpa] = []
                         for item in keywords:
                             if isinstance(item, str):
@@ -51,12 +159,16 @@ class EvidenceTransformer:
                                 self.kpa_keywords[kpa].append(tuple(item))
             except Exception as e:
                 print(f"[WARNING] Failed to load KPA config: {e}")
+        self._build_kpa_tables()
 
         # Load tier keywords
         if tier_keywords_path and Path(tier_keywords_path).exists():
             try:
                 with open(tier_keywords_path) as f:
-                    self.tier_keywords = json.load(f)
+                    self.tier_keywords = {
+                        tier: _dedupe_keywords(keywords)
+                        for tier, keywords in json.load(f).items()
+                    }
             except Exception as e:
                 print(f"[WARNING] Failed to load tier keywords: {e}")
 
@@ -65,26 +177,90 @@ class EvidenceTransformer:
             try:
                 with open(policy_registry_path) as f:
                     self.policy_registry = json.load(f)
+                for policy_config in self.policy_registry.values():
+                    if isinstance(policy_config, dict) and "keywords" in policy_config:
+                        policy_config["keywords"] = _dedupe_keywords(policy_config["keywords"])
             except Exception as e:
                 print(f"[WARNING] Failed to load policy registry: {e}")
-
-    def transform(self, vamp_item: Dict[str, Any]) -> Dict[str, Any]:
-        """Transform a raw VAMP scan result into scored, tiered evidence."""
+        self._build_keyword_matchers()
+
+    def _build_kpa_tables(self) -> None:
+        """Flatten ``kpa_keywords`` into parallel per-keyword tables for scoring.
+
+        Importances, owning KPA ids and per-KPA counts are packed into
+        contiguous ``array.array`` buffers (struct-of-arrays) rather than
+        lists of tuples, so the scoring loop walks flat memory.
+        """
+        # Interned so every output list shares one object per category name
+        self._kpa_names: Tuple[str, ...] = tuple(sys.intern(k) for k in self.kpa_keywords)
+        self._kpa_counts = array.array("i")
+        self._kw_strings: List[str] = []
+        self._kw_importance = array.array("d")
+        self._kw_kpa_id = array.array("i")
+        for kpa_id, kpa in enumerate(self.kpa_keywords):
+            keywords = self.kpa_keywords[kpa]
+            self._kpa_counts.append(len(keywords))
+            for keyword, importance in keywords:
+                self._kw_strings.append(keyword.lower())
+                self._kw_importance.append(float(importance))
+                self._kw_kpa_id.append(kpa_id)
+
+    def _build_keyword_matchers(self) -> None:
+        """Compile KPA, tier and policy keywords into one regex per category."""
+        self._kw_ids_by_string: Dict[str, List[int]] = {}
+        for kw_id, keyword in enumerate(self._kw_strings):
+            self._kw_ids_by_string.setdefault(keyword, []).append(kw_id)
+        self._kpa_regex, self._kpa_expand = _compile_keywords(self._kw_ids_by_string)
+
+        self._tiers_by_keyword: Dict[str, Set[str]] = {}
+        for tier_name, keywords in self.tier_keywords.items():
+            tier_name = sys.intern(tier_name)
+            for keyword in keywords:
+                self._tiers_by_keyword.setdefault(keyword.lower(), set()).add(tier_name)
+        self._tier_regex, self._tier_expand = _compile_keywords(self._tiers_by_keyword)
+
+        # Policy hits are reported in registry order, so keep each policy's rank
+        self._policies_by_keyword: Dict[str, Set[int]] = {}
+        self._policy_ids: Tuple[str, ...] = tuple(sys.intern(p) for p in self.policy_registry)
+        for rank, policy_id in enumerate(self._policy_ids):
+            for keyword in self.policy_registry[policy_id].get("keywords", []):
+                self._policies_by_keyword.setdefault(keyword.lower(), set()).add(rank)
+        self._policy_regex, self._policy_expand = _compile_keywords(self._policies_by_keyword)
+
+    def transform(
+        self,
+        vamp_item: Dict[str, Any],
+        timestamp: Optional[str] = None,
+        in_place: bool = False,
+    ) -> Dict[str, Any]:
+        """Transform a raw VAMP scan result into scored, tiered evidence.
+
+        ``timestamp`` lets batch callers stamp every item with one shared
+        ``_transform_timestamp`` instead of formatting the clock per item.
+        With ``in_place=True`` the computed fields are written onto
+        ``vamp_item`` itself, skipping the shallow copy of large bodies.
+        """
         if not isinstance(vamp_item, dict):
-            return self._safe_default()
+            return self._safe_default(timestamp)
+
+        out = vamp_item if in_place else dict(vamp_item)
 
         # Skip if already transformed
         if vamp_item.get("_transformed"):
-            return dict(vamp_item)
+            return out
 
         # Deduplicate by hash
-        item_hash = vamp_item.get("hash") or self._compute_hash(vamp_item)
-        if item_hash in self.seen_hashes:
-            return {**vamp_item, "_duplicate": True, "hash": item_hash}
-        self.seen_hashes.add(item_hash)
-
-        out = dict(vamp_item)
+        if vamp_item.get("hash"):
+            item_hash = str(vamp_item["hash"])
+            key = _hash_key(item_hash)
+        else:
+            key = self._compute_hash(vamp_item)
+            item_hash = f"{key:016x}"
         out["hash"] = item_hash
+        if key in self.seen_hashes:
+            out["_duplicate"] = True
+            return out
+        self.seen_hashes.add(key)
 
         # Step 1: Classify KPA
         text_for_classification = self._extract_text(vamp_item)
@@ -106,7 +282,7 @@ class EvidenceTransformer:
 
         # Step 5: Add metadata
         out["_transformed"] = True
-        out["_transform_timestamp"] = datetime.utcnow().isoformat()
+        out["_transform_timestamp"] = timestamp or datetime.utcnow().isoformat()
         out["_transform_version"] = "1.0"
 
         return out
@@ -121,43 +297,44 @@ class EvidenceTransformer:
 
     def _classify_kpa(self, text: str) -> List[Tuple[str, float]]:
         """Classify evidence into KPA categories with confidence."""
-        scores: Dict[str, float] = {}
-
-        for kpa, keywords in self.kpa_keywords.items():
-            score = 0.0
-            for keyword, importance in keywords:
-                if keyword.lower() in text:
-                    score += importance
-            if score > 0:
-                scores[kpa] = min(score / max(len(keywords), 1), 1.0)
+        found = _find_keywords(self._kpa_regex, self._kpa_expand, text)
+        if not found:
+            return []
+        # Sorted ids keep the accumulation order (and float sums) stable
+        ids = sorted(i for keyword in found for i in self._kw_ids_by_string[keyword])
+
+        totals: Dict[int, float] = {}
+        for kw_id in ids:
+            kpa_id = self._kw_kpa_id[kw_id]
+            totals[kpa_id] = totals.get(kpa_id, 0.0) + self._kw_importance[kw_id]
+
+        # Normalised by the KPA's configured keyword count
+        scores: Dict[str, float] = {
+            self._kpa_names[k]: min(total / max(self._kpa_counts[k], 1), 1.0)
+            for k, total in totals.items()
+            if total > 0
+        }
 
-        # Return sorted by score, descending
-        return sorted(scores.items(), key=lambda x: -x[1])
+        # Top-K by score, descending (ties keep KPA order, as sorted() did)
+        return heapq.nlargest(self.top_k, scores.items(), key=operator.itemgetter(1))
 
     def _classify_tier(self, item: Dict[str, Any], kpas: List[str]) -> List[str]:
         """Classify evidence tier based on content and KPA."""
         text = self._extract_text(item).lower()
-        tiers = set()
+        tiers: Set[str] = set()
 
-        for tier_name, keywords in self.tier_keywords.items():
-            for keyword in keywords:
-                if keyword.lower() in text:
-                    tiers.add(tier_name)
+        for keyword in _find_keywords(self._tier_regex, self._tier_expand, text):
+            tiers.update(self._tiers_by_keyword[keyword])
 
         return sorted(list(tiers)) or ["Developmental"]  # Default tier
 
     def _check_policies(self, text: str, kpas: List[str]) -> List[str]:
         """Check evidence against policy registry."""
-        hits = []
-
-        for policy_id, policy_config in self.policy_registry.items():
-            keywords = policy_config.get("keywords", [])
-            for keyword in keywords:
-                if keyword.lower() in text:
-                    hits.append(policy_id)
-                    break
+        ranks: Set[int] = set()
+        for keyword in _find_keywords(self._policy_regex, self._policy_expand, text):
+            ranks.update(self._policies_by_keyword[keyword])
 
-        return hits
+        return [self._policy_ids[rank] for rank in sorted(ranks)]
 
     def _is_must_pass_policy(self, policy_id: str) -> bool:
         """Check if a policy is a must-pass (critical) policy."""
@@ -172,15 +349,16 @@ class EvidenceTransformer:
         # Use top score as confidence
         return kpa_scores[0][1] if kpa_scores else 0.0
 
-    def _compute_hash(self, item: Dict[str, Any]) -> str:
-        """Compute SHA256 hash for deduplication."""
-        key_fields = ["source", "path", "hash", "title", "timestamp"]
-        combined = "".join(
-            str(item.get(field, "")) for field in key_fields
-        )
-        return hashlib.sha256(combined.encode()).hexdigest()[:16]
+    def _compute_hash(self, item: Dict[str, Any]) -> int:
+        """Compute a 64-bit BLAKE2b digest, as an int, for deduplication."""
+        h = hashlib.blake2b(digest_size=8)
+        for field in KEY_FIELDS:
+            h.update(str(item.get(field, "")).encode())
+            # Unit separator keeps ("ab", "") distinct from ("a", "b")
+            h.update(b"\x1f")
+        return int.from_bytes(h.digest(), "big")
 
-    def _safe_default(self) -> Dict[str, Any]:
+    def _safe_default(self, timestamp: Optional[str] = None) -> Dict[str, Any]:
         """Return safe default transformed object."""
         return {
             "kpa": [],
@@ -189,12 +367,43 @@ class EvidenceTransformer:
             "must_pass_risks": [],
             "confidence": 0.0,
             "_transformed": True,
-            "_transform_timestamp": datetime.utcnow().isoformat(),
+            "_transform_timestamp": timestamp or datetime.utcnow().isoformat(),
         }
 
-    def batch_transform(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Transform multiple evidence items."""
-        return [self.transform(item) for item in items]
+    def batch_transform(
+        self,
+        items: List[Dict[str, Any]],
+        n_workers: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Transform multiple evidence items.
+
+        Items are transformed in-process unless the caller opts in to a
+        process pool by passing ``n_workers`` (2 or more); even then, batches
+        under ``PARALLEL_THRESHOLD`` items stay in-process. Workers only
+        deduplicate within their own chunk, so results are re-checked here in
+        input order against ``seen_hashes`` to flag cross-chunk duplicates.
+        """
+        timestamp = datetime.utcnow().isoformat()
+        workers = n_workers or 1
+        if workers < 2 or len(items) < PARALLEL_THRESHOLD:
+            return [self.transform(item, timestamp=timestamp) for item in items]
+
+        chunk_size = max(1, -(-len(items) // (workers * 4)))
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self,)
+        ) as executor:
+            results = [out for chunk in executor.map(_worker_transform_chunk, chunks, repeat(timestamp)) for out in chunk]
+
+        for idx, (item, out) in enumerate(zip(items, results)):
+            if not isinstance(item, dict) or item.get("_transformed") or out.get("_duplicate"):
+                continue
+            key = _hash_key(out["hash"])
+            if key in self.seen_hashes:
+                results[idx] = {**item, "_duplicate": True, "hash": out["hash"]}
+            else:
+                self.seen_hashes.add(key)
+        return results
 
     def reset_seen_hashes(self) -> None:
         """Clear deduplication cache for new batch."""
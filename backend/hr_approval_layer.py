@@ -5,11 +5,13 @@ Orchestrates multi-level approval workflows with RBAC integration.
 Maintains deterministic approval chains with full audit trails.
 """
 
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 import logging
+import operator as op
 import uuid
 
 
@@ -31,7 +33,7 @@ class EvidenceDecision(Enum):
     APPROVED_WITH_CAVEATS = "approved_with_caveats"
 
 
-@dataclass
+@dataclass(slots=True)
 class ApprovalRequest:
     """Evidence approval request in workflow."""
     request_id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -66,52 +68,45 @@ class ApprovalRequest:
         })
 
 
+# Condition operators, bound once per condition as (value, expected) -> bool
+CONDITION_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "eq": op.eq,
+    "lt": op.lt,
+    "gt": op.gt,
+    "contains": lambda value, expected: bool(value) and expected in value,
+    "in": lambda value, expected: value in expected,
+}
+
+
+def _never(value: Any, expected: Any) -> bool:
+    """Predicate for unknown operators, which never match."""
+    return False
+
+
 class ApprovalRule:
     """Rules for automated approval decisions."""
     
+    __slots__ = ("name", "rule_type", "conditions", "enabled")
+    
     def __init__(self, name: str, rule_type: str):
         self.name = name
         self.rule_type = rule_type  # 'auto_approve', 'auto_reject', 'escalate'
-        self.conditions: List[Dict] = []
+        # (field, predicate, expected value) with the operator resolved up front
+        self.conditions: List[Tuple[str, Callable[[Any, Any], bool], Any]] = []
         self.enabled = True
     
-    def add_condition(self, field: str, operator: str, value: any):
+    def add_condition(self, field: str, operator: str, value: Any):
         """Add condition to rule."""
-        self.conditions.append({
-            "field": field,
-            "operator": operator,  # 'eq', 'lt', 'gt', 'contains', etc.
-            "value": value
-        })
+        # operator: 'eq', 'lt', 'gt', 'contains', 'in'
+        predicate = CONDITION_OPERATORS.get(operator, _never)
+        self.conditions.append((field, predicate, value))
     
     def evaluate(self, context: Dict) -> bool:
         """Check if rule conditions match context."""
         if not self.enabled:
             return False
         
-        for condition in self.conditions:
-            field_value = context.get(condition["field"])
-            if not self._evaluate_condition(field_value, condition):
-                return False
-        
-        return True
-    
-    def _evaluate_condition(self, value: any, condition: Dict) -> bool:
-        """Evaluate single condition."""
-        operator = condition["operator"]
-        expected = condition["value"]
-        
-        if operator == "eq":
-            return value == expected
-        elif operator == "lt":
-            return value < expected
-        elif operator == "gt":
-            return value > expected
-        elif operator == "contains":
-            return expected in value if value else False
-        elif operator == "in":
-            return value in expected
-        
-        return False
+        return all(predicate(context.get(field), expected) for field, predicate, expected in self.conditions)
 
 
 class ApprovalWorkflow:
@@ -120,9 +115,15 @@ class ApprovalWorkflow:
     def __init__(self):
         self.logger = logging.getLogger("ApprovalWorkflow")
         self.requests: Dict[str, ApprovalRequest] = {}
-        self.rules: List[ApprovalRule] = []
+        self._rules: List[ApprovalRule] = []  # every rule, in added order
+        # Indexes over _rules, kept in step by add_approval_rule
+        self.rules_by_type: Dict[str, List[ApprovalRule]] = defaultdict(list)
+        self._auto_rules: List[ApprovalRule] = []  # auto_approve/auto_reject, in added order
         self.approval_chain: Dict[str, List[str]] = {}  # evidence_type -> approver chain
         self.audit_trail: List[Dict] = []
+        self._trail_by_request: Dict[str, List[Dict]] = {}  # request_id -> shared log entries
+        # assigned_to -> ids of PENDING requests (dict keys as an ordered set)
+        self._pending_by_assignee: Dict[str, Dict[str, None]] = defaultdict(dict)
     
     def create_approval_request(self, evidence_id: str, evidence_type: str, requester_id: str) -> ApprovalRequest:
         """Create new approval request for evidence."""
@@ -134,6 +135,7 @@ class ApprovalWorkflow:
         )
         
         self.requests[request.request_id] = request
+        self._index_pending(request)
         self._log_action("CREATED", request.request_id, requester_id, f"Evidence: {evidence_id}")
         
         return request
@@ -146,6 +148,7 @@ class ApprovalWorkflow:
             return False
         
         request.add_approval(approver_id, decision.value, comments)
+        self._unindex_pending(request)
         
         # Check if more approvals needed
         if self._needs_more_approvals(request):
@@ -153,6 +156,7 @@ class ApprovalWorkflow:
             next_approver = self._get_next_approver(request.evidence_type)
             request.assigned_to = next_approver
             request.status = ApprovalStatus.PENDING
+            self._index_pending(request)
         else:
             # Workflow complete
             request.status = ApprovalStatus.APPROVED
@@ -168,6 +172,7 @@ class ApprovalWorkflow:
             return False
         
         request.add_rejection(rejector_id, reason, comments)
+        self._unindex_pending(request)
         request.status = ApprovalStatus.REJECTED
         
         self._log_action("REJECTED", request_id, rejector_id, f"Reason: {reason}")
@@ -180,19 +185,32 @@ class ApprovalWorkflow:
             return False
         
         # Get escalation approver (usually manager level)
+        self._unindex_pending(request)
         request.assigned_to = self._get_escalation_approver(request.evidence_type)
         request.status = ApprovalStatus.ESCALATED
         
         self._log_action("ESCALATED", request_id, "system", f"Reason: {reason}")
         return True
     
+    @property
+    def rules(self) -> Tuple[ApprovalRule, ...]:
+        """All approval rules in the order they were added; use add_approval_rule to add one."""
+        return tuple(self._rules)
+    
     def add_approval_rule(self, rule: ApprovalRule):
         """Add automated approval rule."""
-        self.rules.append(rule)
+        self._rules.append(rule)
+        self.rules_by_type[rule.rule_type].append(rule)
+        if rule.rule_type in ("auto_approve", "auto_reject"):
+            self._auto_rules.append(rule)
     
     def evaluate_auto_approval(self, request_id: str, context: Dict) -> Optional[EvidenceDecision]:
-        """Evaluate if request can be auto-approved."""
-        for rule in self.rules:
+        """Evaluate if request can be auto-approved.
+
+        Only ``auto_approve`` and ``auto_reject`` rules are visited; the first
+        matching rule, in the order rules were added, decides.
+        """
+        for rule in self._auto_rules:
             if rule.rule_type == "auto_approve" and rule.evaluate(context):
                 self._log_action("AUTO_APPROVED", request_id, "system", f"Rule: {rule.name}")
                 return EvidenceDecision.APPROVED_FOR_HR_USE
@@ -204,10 +222,19 @@ class ApprovalWorkflow:
     
     def get_pending_requests(self, approver_id: str) -> List[ApprovalRequest]:
         """Get pending requests for approver."""
-        return [
-            req for req in self.requests.values()
-            if req.assigned_to == approver_id and req.status == ApprovalStatus.PENDING
-        ]
+        pending = self._pending_by_assignee.get(approver_id, {})
+        return [self.requests[request_id] for request_id in pending]
+    
+    def _index_pending(self, request: ApprovalRequest):
+        """Track a pending request under its current assignee."""
+        if request.status == ApprovalStatus.PENDING:
+            self._pending_by_assignee[request.assigned_to][request.request_id] = None
+    
+    def _unindex_pending(self, request: ApprovalRequest):
+        """Drop a request from its current assignee's pending index."""
+        pending = self._pending_by_assignee.get(request.assigned_to)
+        if pending is not None:
+            pending.pop(request.request_id, None)
     
     def _needs_more_approvals(self, request: ApprovalRequest) -> bool:
         """Check if more approvals needed based on policy."""
@@ -236,11 +263,12 @@ class ApprovalWorkflow:
             "details": details
         }
         self.audit_trail.append(log_entry)
+        self._trail_by_request.setdefault(request_id, []).append(log_entry)
     
     def get_audit_trail(self, request_id: Optional[str] = None) -> List[Dict]:
         """Get audit trail of workflow actions."""
         if request_id:
-            return [log for log in self.audit_trail if log["request_id"] == request_id]
+            return list(self._trail_by_request.get(request_id, ()))
         return self.audit_trail.copy()
     
     def get_request_status(self, request_id: str) -> Optional[Dict]:
@@ -3,8 +3,9 @@
 The interactive PowerShell experience should only surface single-line errors
 while still preserving full diagnostics for post-mortem analysis. This module
 configures loggers with a quiet console handler and a rotating file handler
-for deep debugging. It also records structured integrity feedback to an Excel
-ledger so background health checks stay invisible to end users.
+for deep debugging. It also records structured integrity feedback to an
+append-only JSON Lines ledger so background health checks stay invisible to
+end users; the ledger can be rolled up into Excel on demand.
 """
 
 from __future__ import annotations
@@ -12,17 +13,39 @@ from __future__ import annotations
 import json
 import logging
 import os
+import threading
 from datetime import datetime
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Any, Dict
 
-import pandas as pd
+try:  # C JSON encoder for the feedback ledger
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
 
 LOG_DIR = Path(os.environ.get("VAMP_LOG_DIR", Path(__file__).parent / "logs"))
-LOG_DIR.mkdir(parents=True, exist_ok=True)
 
-DEFAULT_FEEDBACK_PATH = LOG_DIR / "feedback_tags.xlsx"
+# Serialises logger setup so concurrent callers cannot attach duplicate handlers.
+_CONFIG_LOCK = threading.Lock()
+_LOG_DIR_READY = False
+
+DEFAULT_FEEDBACK_PATH = LOG_DIR / "feedback_tags.jsonl"
+
+
+def _json_line(payload: Dict[str, Any]) -> bytes:
+    """Encode ``payload`` as one newline-terminated UTF-8 JSON line."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(payload, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _ensure_log_dir() -> None:
+    """Create ``LOG_DIR`` on first use rather than at import time."""
+    global _LOG_DIR_READY
+    if not _LOG_DIR_READY:
+        LOG_DIR.mkdir(parents=True, exist_ok=True)
+        _LOG_DIR_READY = True
 
 
 def configure_quiet_logger(
@@ -37,31 +60,40 @@ def configure_quiet_logger(
 
     Console logs default to ``ERROR`` with a short format. A rotating file
     handler captures richer context for troubleshooting without spamming live
-    terminals. The configuration is idempotent per logger name.
+    terminals. The configuration is idempotent per logger name and safe to
+    call from several threads; the log file is only opened on first emit.
     """
 
     logger = logging.getLogger(name)
     if getattr(logger, "_vamp_configured", False):
         return logger
 
-    logger.setLevel(logging.DEBUG)
-
-    console_level_name = os.environ.get(env_level_var, default_console_level).upper()
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(getattr(logging, console_level_name, logging.ERROR))
-    console_handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
-
-    file_level_name = (file_level or os.environ.get(f"{env_level_var}_FILE", "INFO")).upper()
-    file_handler = RotatingFileHandler(LOG_DIR / file_name, maxBytes=1_000_000, backupCount=3)
-    file_handler.setLevel(getattr(logging, file_level_name, logging.INFO))
-    file_handler.setFormatter(
-        logging.Formatter("%(asctime)s [%(levelname)s] %(name)s - %(message)s")
-    )
-
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
-    logger.propagate = False
-    logger._vamp_configured = True  # type: ignore[attr-defined]
+    with _CONFIG_LOCK:
+        # Re-check under the lock: another thread may have finished setup
+        if getattr(logger, "_vamp_configured", False):
+            return logger
+
+        _ensure_log_dir()
+        logger.setLevel(logging.DEBUG)
+
+        console_level_name = os.environ.get(env_level_var, default_console_level).upper()
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(getattr(logging, console_level_name, logging.ERROR))
+        console_handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+
+        file_level_name = (file_level or os.environ.get(f"{env_level_var}_FILE", "INFO")).upper()
+        file_handler = RotatingFileHandler(
+            LOG_DIR / file_name, maxBytes=1_000_000, backupCount=3, delay=True
+        )
+        file_handler.setLevel(getattr(logging, file_level_name, logging.INFO))
+        file_handler.setFormatter(
+            logging.Formatter("%(asctime)s [%(levelname)s] %(name)s - %(message)s")
+        )
+
+        logger.addHandler(console_handler)
+        logger.addHandler(file_handler)
+        logger.propagate = False
+        logger._vamp_configured = True  # type: ignore[attr-defined]
     return logger
 
 
@@ -73,34 +105,53 @@ def record_feedback_tag(
     context: Dict[str, Any] | None = None,
     path: Path = DEFAULT_FEEDBACK_PATH,
 ) -> None:
-    """Persist a structured feedback event to an Excel ledger.
+    """Append a structured feedback event to a JSON Lines ledger.
 
     The ledger keeps internal integrity signals out of the live UI while
-    preserving breadcrumbs for support teams. Failures to write feedback
-    entries are intentionally silent to avoid impacting runtime behavior.
+    preserving breadcrumbs for support teams. Each event is a single appended
+    line, so the cost does not grow with the ledger. Failures to write
+    feedback entries are intentionally silent to avoid impacting runtime
+    behavior.
     """
 
     try:
+        _ensure_log_dir()
         payload: Dict[str, Any] = {
             "timestamp": datetime.utcnow().isoformat(timespec="seconds"),
             "severity": severity,
             "event": event,
             "message": message,
-            "context": json.dumps(context or {}),
+            "context": context or {},
         }
-
-        new_frame = pd.DataFrame([payload])
-        if path.exists():
-            try:
-                existing = pd.read_excel(path)
-                combined = pd.concat([existing, new_frame], ignore_index=True)
-            except Exception:
-                combined = new_frame
-        else:
-            combined = new_frame
-
-        with pd.ExcelWriter(path, engine="openpyxl", mode="w") as writer:
-            combined.to_excel(writer, index=False)
+        with open(path, "ab") as handle:
+            handle.write(_json_line(payload))
     except Exception:
         # Feedback persistence must never interrupt runtime behavior.
         return
+
+
+def export_feedback_to_excel(
+    jsonl_path: Path = DEFAULT_FEEDBACK_PATH,
+    xlsx_path: Path | None = None,
+) -> Path:
+    """Roll the JSON Lines feedback ledger up into an Excel workbook.
+
+    Intended for manual or shutdown-time export; ``context`` is written as a
+    JSON string column. Returns the path of the written workbook.
+    """
+
+    import pandas as pd
+
+    xlsx_path = xlsx_path or jsonl_path.with_suffix(".xlsx")
+    rows = []
+    with open(jsonl_path, encoding="utf-8") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            row["context"] = json.dumps(row.get("context") or {})
+            rows.append(row)
+
+    with pd.ExcelWriter(xlsx_path, engine="openpyxl", mode="w") as writer:
+        pd.DataFrame(rows).to_excel(writer, index=False)
+    return xlsx_path
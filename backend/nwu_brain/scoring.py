@@ -39,6 +39,7 @@ from typing import Any, Dict, Iterable, List, Optional, Tuple
 # -----------------------
 
 _JSON_RE_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL
+_WS_RE = re.compile(r"\s+")
 
 
 def _read_text(path: Path) -> str:
@@ -133,6 +134,10 @@ class NWUScorer:
         # Prepare tier regex lists (TOLERANT to dict|list|string)
         self._compiled_tiers: List[Tuple[str, List[re.Pattern]]] = self._prepare_tiers(self.tier_keywords_raw)
 
+        # KPA router and values-index regexes are shared by every compute(); compile once
+        self._compiled_kpa_rules: List[Tuple[re.Pattern, List[int]]] = self._prepare_kpa_rules(self.kpa_router)
+        self._compiled_values: Optional[List[Tuple[str, List[re.Pattern]]]] = self._prepare_values(self.values_index)
+
         # Build band thresholds (defaults if not present)
         self.bands: List[BandRule] = self._load_bands(self.institution_profile)
 
@@ -429,20 +434,45 @@ class NWUScorer:
             out.extend(_as_kpa_list(r["by_platform"].get(plat_key, [])))
 
         # 3) regex content/title
-        if "by_regex" in r and (text or title):
+        if self._compiled_kpa_rules and (text or title):
             hay = f"{title}\n{text}" if text else title
-            for rule in (r["by_regex"] or []):
-                pat = str(rule.get("pattern") or "")
-                if not pat:
-                    continue
-                if _compile_pat(pat).search(hay):
-                    out.extend(_as_kpa_list(rule.get("kpa", [])))
+            for pattern, kpas in self._compiled_kpa_rules:
+                if pattern.search(hay):
+                    out.extend(kpas)
 
         # Dedup + sanitize
         out_uni = sorted({k for k in out if isinstance(k, int) and 1 <= k <= 5})
         return out_uni
 
+    def _prepare_kpa_rules(self, router: Any) -> List[Tuple[re.Pattern, List[int]]]:
+        """
+        Compile kpa_router.json "by_regex" rules into (pattern, kpa_list) pairs, in order.
+        """
+        rules = router.get("by_regex") if isinstance(router, dict) else None
+        out: List[Tuple[re.Pattern, List[int]]] = []
+        for rule in (rules or []):
+            pat = str(rule.get("pattern") or "")
+            if not pat:
+                continue
+            out.append((_compile_pat(pat), _as_kpa_list(rule.get("kpa", []))))
+        return out
+
     # --- Values index ---
+    def _prepare_values(self, spec: Any) -> Optional[List[Tuple[str, List[re.Pattern]]]]:
+        """
+        Compile values_index.json into (value_name, [compiled_patterns]).
+        Returns None when the index has no "values" list.
+        """
+        arr = spec.get("values") if isinstance(spec, dict) else None
+        if not isinstance(arr, list):
+            return None
+        out: List[Tuple[str, List[re.Pattern]]] = []
+        for v in arr:
+            name = str(v.get("name") or "").strip()
+            pats = [_compile_pat(str(pat)) for pat in (v.get("patterns") or []) if pat]
+            out.append((name, pats))
+        return out
+
     def _score_values(self, text: str) -> Tuple[float, List[str]]:
         """
         Very fast values hit counter. Expected structure:
@@ -450,21 +480,14 @@ class NWUScorer:
         Score is a squashed transform into 0..5.
         """
         hits: List[str] = []
-        spec = self.values_index or {}
-        arr = spec.get("values") if isinstance(spec, dict) else None
-        if not isinstance(arr, list):
+        if self._compiled_values is None:
             return 0.0, hits
 
         total_hits = 0
-        for v in arr:
-            name = str(v.get("name") or "").strip()
-            pats = v.get("patterns") or []
+        for name, pats in self._compiled_values:
             count_for_value = 0
-            for pat in pats:
-                if not pat:
-                    continue
-                m = len(list(_compile_pat(str(pat)).finditer(text)))
-                count_for_value += m
+            for p in pats:
+                count_for_value += len(p.findall(text))
             if count_for_value > 0 and name:
                 hits.append(name)
                 total_hits += min(count_for_value, 5)  # cap per value to avoid runaway counts
@@ -589,5 +612,5 @@ def _snippet(hay: str, a: int, b: int, radius: int = 100) -> str:
     b0 = min(len(hay), b + radius)
     snip = hay[a0:b0].strip()
     # compact whitespace
-    snip = re.sub(r"\s+", " ", snip)
+    snip = _WS_RE.sub(" ", snip)
     return snip[:240]
@@ -1,46 +1,53 @@
 """Centralised OneDrive selector definitions used by Playwright scrapers."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Tuple
 
 
 @dataclass(frozen=True)
 class OneDriveSelectorConfig:
-    grid: List[str]
-    row: List[str]
-    name: List[str]
-    modified: List[str]
-    open_action: List[str]
-    download_action: List[str]
+    grid: Tuple[str, ...]
+    row: Tuple[str, ...]
+    name: Tuple[str, ...]
+    modified: Tuple[str, ...]
+    open_action: Tuple[str, ...]
+    download_action: Tuple[str, ...]
+    # Comma-joined unions, built once so a single query covers every variant
+    grid_union: str = field(init=False)
+    row_union: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "grid_union", ", ".join(self.grid))
+        object.__setattr__(self, "row_union", ", ".join(self.row))
 
 
 def _default_onedrive_config() -> OneDriveSelectorConfig:
     return OneDriveSelectorConfig(
-        grid=[
+        grid=(
             '[role="main"] [data-automationid="Grid"]',
             '[data-automationid="TopBar"] ~ div [role="grid"]',
-        ],
-        row=[
+        ),
+        row=(
             '[role="row"]',
             '[data-automationid="row"]',
-        ],
-        name=[
+        ),
+        name=(
             '[data-automationid="name"]',
             '[aria-label*="Name"]',
-        ],
-        modified=[
+        ),
+        modified=(
             '[data-automationid="modified"]',
             '[aria-label*="Modified"]',
-        ],
-        open_action=[
+        ),
+        open_action=(
             'button[aria-label*="Open"]',
             'a[role="link"]',
-        ],
-        download_action=[
+        ),
+        download_action=(
             'button[aria-label*="Download"]',
             'button[data-automationid="Download"]',
-        ],
+        ),
     )
 
 
@@ -6,10 +6,14 @@ update this module instead of scattering ad-hoc selectors across scrapers.
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
-from functools import lru_cache
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Tuple
+
+try:  # C JSON parser for the shared selector file
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
 
 _BASE_DIR = Path(__file__).resolve().parent
 _SHARED_JSON = _BASE_DIR.parent / "frontend" / "extension" / "shared" / "outlook_selectors.json"
@@ -17,17 +21,24 @@ _SHARED_JSON = _BASE_DIR.parent / "frontend" / "extension" / "shared" / "outlook
 
 @dataclass(frozen=True)
 class OutlookSelectorConfig:
-    inbox_list: List[str]
-    message_row: List[str]
-    message_subject: List[str]
-    message_sender: List[str]
-    message_preview: List[str]
-    message_date: List[str]
-    message_open: List[str]
-    attachment_list: List[str]
-    attachment_item: List[str]
-    attachment_name: List[str]
-    body: List[str]
+    inbox_list: Tuple[str, ...]
+    message_row: Tuple[str, ...]
+    message_subject: Tuple[str, ...]
+    message_sender: Tuple[str, ...]
+    message_preview: Tuple[str, ...]
+    message_date: Tuple[str, ...]
+    message_open: Tuple[str, ...]
+    attachment_list: Tuple[str, ...]
+    attachment_item: Tuple[str, ...]
+    attachment_name: Tuple[str, ...]
+    body: Tuple[str, ...]
+    # Comma-joined unions, built once so a single query covers every variant
+    inbox_list_union: str = field(init=False)
+    message_row_union: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "inbox_list_union", ", ".join(self.inbox_list))
+        object.__setattr__(self, "message_row_union", ", ".join(self.message_row))
 
 
 OUTLOOK_SELECTOR_SETS: Dict[str, Dict[str, str]] = {
@@ -43,15 +54,16 @@ OUTLOOK_SELECTOR_SETS: Dict[str, Dict[str, str]] = {
     },
 }
 
-OUTLOOK_ROW_FALLBACKS: List[str] = [
+OUTLOOK_ROW_FALLBACKS: Tuple[str, ...] = (
     OUTLOOK_SELECTOR_SETS["v2024_q4"]["message_row"],
     OUTLOOK_SELECTOR_SETS["v2024_q3"]["message_row"],
     "div[role=\"listitem\"]",
-]
+)
 
-_DEFAULT_ROW_SELECTORS: List[str] = list(dict.fromkeys(
+# Deduplicated once at import; shared by every caller as an immutable tuple
+_DEFAULT_ROW_SELECTORS: Tuple[str, ...] = tuple(dict.fromkeys(
     OUTLOOK_ROW_FALLBACKS
-    + [
+    + (
         "[data-convid]",
         "[data-conversation-id]",
         "[data-conversationid]",
@@ -62,26 +74,25 @@ _DEFAULT_ROW_SELECTORS: List[str] = list(dict.fromkeys(
         "[data-app-section=\"Mail\"] [role=\"treeitem\"]",
         "[role=\"option\"][data-convid]",
         "[role=\"option\"][data-item-id]",
-    ]
+    )
 ))
 
 
-@lru_cache(maxsize=1)
-def load_outlook_row_selectors() -> List[str]:
-    """Return the canonical list of Outlook row selectors.
+def _read_row_selectors() -> Tuple[str, ...]:
+    """Read the Outlook row selectors from the shared JSON file.
 
     The selectors are stored in a JSON file that is bundled with both the
-    browser extension and the backend so that changes stay in lockstep. The
-    JSON is cached to avoid repeatedly touching the filesystem during long
-    scraping sessions. If the JSON is unavailable, we fall back to a
-    versioned selector matrix that prioritizes the latest Outlook UI updates
-    while keeping legacy selectors for older layouts.
+    browser extension and the backend so that changes stay in lockstep. If
+    the JSON is unavailable, we fall back to a versioned selector matrix that
+    prioritizes the latest Outlook UI updates while keeping legacy selectors
+    for older layouts.
     """
 
     try:
-        data = json.loads(_SHARED_JSON.read_text(encoding="utf-8"))
+        raw = _SHARED_JSON.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         if isinstance(data, list):
-            cleaned = [s for s in (str(x).strip() for x in data) if s]
+            cleaned = tuple(s for s in (str(x).strip() for x in data) if s)
             if cleaned:
                 return cleaned
     except FileNotFoundError:
@@ -90,81 +101,95 @@ def load_outlook_row_selectors() -> List[str]:
         # Fall back to the baked-in defaults if anything goes wrong.
         pass
 
-    return list(_DEFAULT_ROW_SELECTORS)
+    return _DEFAULT_ROW_SELECTORS
+
+
+# Read once at import so long scraping sessions never touch the filesystem again
+_ROW_SELECTORS: Tuple[str, ...] = _read_row_selectors()
+
+
+def load_outlook_row_selectors() -> Tuple[str, ...]:
+    """Return the canonical Outlook row selectors as a tuple."""
+    return _ROW_SELECTORS
 
 
 def _default_config() -> OutlookSelectorConfig:
     row_selectors = load_outlook_row_selectors()
     return OutlookSelectorConfig(
-        inbox_list=[
+        inbox_list=(
             OUTLOOK_SELECTOR_SETS["v2024_q4"]["message_list"],
             '[aria-label*="Message list"]',
             "[role='list'][data-convid]",
-        ],
+        ),
         message_row=row_selectors,
-        message_subject=[
+        message_subject=(
             OUTLOOK_SELECTOR_SETS["v2024_q4"]["subject"],
             OUTLOOK_SELECTOR_SETS["v2024_q3"]["subject"],
             "[role='heading']",  # compact list view
-        ],
-        message_sender=[
+        ),
+        message_sender=(
             '[data-test-id="message-sender"]',
             '[data-automationid="senders"]',
             '[aria-label*="From"]',
-        ],
-        message_preview=[
+        ),
+        message_preview=(
             '[data-test-id="message-preview"]',
             '.messagePreview',
             '.ms-ListItem-tertiaryText',
-        ],
-        message_date=[
+        ),
+        message_date=(
             '[data-test-id="message-received"]',
             'time',
             'span[aria-label*="AM"]',
             'span[aria-label*="PM"]',
             'span[title*="202"]',
-        ],
-        message_open=[
+        ),
+        message_open=(
             '[role="listitem"][data-convid]',
-            '[role="option"][data-convid]'
-        ],
-        attachment_list=[
+            '[role="option"][data-convid]',
+        ),
+        attachment_list=(
             'div[role="group"][aria-label*="Attachments"]',
             '[data-test-id="attachment-group"]',
-        ],
-        attachment_item=[
+        ),
+        attachment_item=(
             '[data-test-id="attachment-card"]',
             '[data-test-id="attachment-preview"]',
             '[data-log-name="Attachment"]',
             'div[role="group"][aria-label*="Attachments"] [role="button"]',
-        ],
-        attachment_name=[
+        ),
+        attachment_name=(
             '[data-test-id="attachment-name"]',
             'div[role="text"]',
-            '[title]',
-            'span',
-        ],
-        body=[
+        ),
+        body=(
             'div[role="document"]',
             '[aria-label*="Message body"]',
-        ],
+        ),
     )
 
 
 OUTLOOK_SELECTORS = _default_config()
-OUTLOOK_ROW_SELECTORS: List[str] = OUTLOOK_SELECTORS.message_row
-ATTACHMENT_CANDIDATES: List[str] = OUTLOOK_SELECTORS.attachment_item
-ATTACHMENT_NAME_SELECTORS: List[str] = OUTLOOK_SELECTORS.attachment_name
-BODY_SELECTORS: List[str] = OUTLOOK_SELECTORS.body
+OUTLOOK_ROW_SELECTORS: Tuple[str, ...] = OUTLOOK_SELECTORS.message_row
+ATTACHMENT_CANDIDATES: Tuple[str, ...] = OUTLOOK_SELECTORS.attachment_item
+ATTACHMENT_NAME_SELECTORS: Tuple[str, ...] = OUTLOOK_SELECTORS.attachment_name
+BODY_SELECTORS: Tuple[str, ...] = OUTLOOK_SELECTORS.body
+
+# Catch-alls that match almost any card; only tried once the specific names miss
+ATTACHMENT_NAME_FALLBACK_SELECTORS: Tuple[str, ...] = ('[title]', 'span')
+
+OUTLOOK_ROW_UNION: str = OUTLOOK_SELECTORS.message_row_union
 
 __all__ = [
     "OUTLOOK_SELECTORS",
     "OUTLOOK_ROW_SELECTORS",
+    "OUTLOOK_ROW_UNION",
     "OUTLOOK_ROW_FALLBACKS",
     "OUTLOOK_SELECTOR_SETS",
     "OutlookSelectorConfig",
     "load_outlook_row_selectors",
     "ATTACHMENT_CANDIDATES",
     "ATTACHMENT_NAME_SELECTORS",
+    "ATTACHMENT_NAME_FALLBACK_SELECTORS",
     "BODY_SELECTORS",
 ]
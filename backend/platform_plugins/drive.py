@@ -25,7 +25,7 @@ class GoogleDriveConnector(PlatformConnector):
         }
 
     def required_scopes(self) -> Iterable[str]:
-        return []
+        return ()
 
     def connect(self, **kwargs) -> None:
         logger.debug("Google Drive connector invoked with %s", kwargs)
@@ -26,7 +26,7 @@ class OneDriveConnector(PlatformConnector):
         }
 
     def required_scopes(self) -> Iterable[str]:
-        return []
+        return ()
 
     def connect(self, **kwargs) -> None:
         logger.debug("OneDrive connector invoked with %s", kwargs)
@@ -24,7 +24,7 @@ class OutlookConnector(PlatformConnector):
         }
 
     def required_scopes(self) -> Iterable[str]:
-        return []
+        return ()
 
     def connect(self, **kwargs) -> None:
         logger.debug("Outlook connector invoked with %s", kwargs)
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import time
+import asyncio
+import logging
 from pathlib import Path
 from typing import Any, Awaitable, Callable, Dict, List, Optional
 
@@ -31,15 +32,83 @@ __all__ = [
     "get_or_create_browser_context",
 ]
 
+logger = logging.getLogger("vamp.playwright_browser_agent")
+
+# Re-save storage state while a context is open so rotated session tokens survive
+STORAGE_STATE_SAVE_INTERVAL = 300  # seconds
+
 
 async def _page_has_any_selector(page: Any, selectors: List[str], timeout: int = 2000) -> bool:
-    for sel in selectors:
-        try:
-            await page.wait_for_selector(sel, timeout=timeout)
-            return True
-        except Exception:
-            continue
-    return False
+    """Return True as soon as any selector appears within ``timeout`` ms.
+
+    All selectors are awaited concurrently, so the call costs at most one
+    ``timeout`` rather than one per selector.
+    """
+    tasks = [asyncio.ensure_future(page.wait_for_selector(sel, timeout=timeout)) for sel in selectors]
+    try:
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            if any(not task.cancelled() and task.exception() is None for task in done):
+                return True
+        return False
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _save_storage_state(context: Any, state_file: Path) -> bool:
+    """Write the context's cookies and localStorage to ``state_file``.
+
+    Never raises; returns False when the state could not be saved.
+    """
+    try:
+        await context.storage_state(path=str(state_file))
+    except Exception as exc:
+        logger.debug("Unable to save storage state to %s: %s", state_file, exc)
+        return False
+    return True
+
+
+def _keep_storage_state_fresh(
+    context: Any, state_file: Path, interval: float = STORAGE_STATE_SAVE_INTERVAL
+) -> "asyncio.Task[None]":
+    """Re-save storage state every ``interval`` seconds while the context is usable.
+
+    The loop stops when the context closes, when its browser disconnects, or
+    after the first failed save. Playwright only fires ``close`` after the
+    context is gone, when its state can no longer be read, so freshness comes
+    from the periodic save instead.
+    """
+
+    async def _refresh() -> None:
+        while True:
+            await asyncio.sleep(interval)
+            if not await _save_storage_state(context, state_file):
+                logger.info("Stopped refreshing storage state for %s after a failed save", state_file)
+                return
+
+    task = asyncio.ensure_future(_refresh())
+
+    def _stop(*_: Any) -> None:
+        task.cancel()
+
+    context.on("close", _stop)
+    browser = getattr(context, "browser", None)
+    if browser is not None:
+        browser.on("disconnected", _stop)
+        # The browser outlives its contexts; don't leave one listener behind per context
+        task.add_done_callback(lambda _: browser.remove_listener("disconnected", _stop))
+    return task
+
+
+async def _persist_ready_context(context: Any, state_file: Optional[Path]) -> Any:
+    """Save storage state once the workspace is ready and keep it fresh."""
+    if state_file:
+        await _save_storage_state(context, state_file)
+        _keep_storage_state_fresh(context, state_file)
+    return context
 
 
 async def get_or_create_browser_context(
@@ -54,7 +123,10 @@ async def get_or_create_browser_context(
 
     If ``storage_path`` exists the cookies/session are loaded. Otherwise the
     user is guided through a manual login flow; once ``ready_selectors`` are
-    visible the storage state is persisted for future runs.
+    visible the storage state is persisted for future runs, and re-saved every
+    :data:`STORAGE_STATE_SAVE_INTERVAL` seconds while the context stays open.
+    ``login_indicators`` is accepted for backwards compatibility only; the
+    wait is driven by ``ready_selectors`` alone.
     """
 
     await ensure_browser()
@@ -76,33 +148,14 @@ async def get_or_create_browser_context(
     await page.goto(login_url, timeout=60000)
 
     ready_indicators = list(ready_selectors)
-    login_indicators = login_indicators or [
-        "button:has-text('Sign in')",
-        "input[type=\"email\"]",
-        "input[name=\"loginfmt\"]",
-    ]
 
     if await _page_has_any_selector(page, ready_indicators, timeout=3000):
-        if state_file:
-            await context.storage_state(path=str(state_file))
-        return context
+        return await _persist_ready_context(context, state_file)
 
-    deadline = time.time() + timeout
-    last_ping = 0.0
     try:
-        while time.time() < deadline:
-            if await _page_has_any_selector(page, ready_indicators, timeout=2000):
-                if state_file:
-                    await context.storage_state(path=str(state_file))
-                return context
-
-            if await _page_has_any_selector(page, login_indicators, timeout=1500):
-                # Still on login form; keep waiting
-                pass
-
-            if time.time() - last_ping > 30:
-                last_ping = time.time()
-            await page.wait_for_timeout(1000)
+        # One race bounded by the full login timeout; Playwright enforces the deadline
+        if await _page_has_any_selector(page, ready_indicators, timeout=timeout * 1000):
+            return await _persist_ready_context(context, state_file)
     except Exception as exc:
         await context.close()
         raise RuntimeError(f"Browser context error: {exc}") from exc
@@ -120,19 +173,7 @@ async def run_scan_active_compat(*args: Any, **kwargs: Any) -> List[Dict[str, An
 def run_scan_active_sync(*args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
     """Synchronously execute :func:`run_scan_active` for legacy scripts."""
 
-    import asyncio
-
-    loop = asyncio.new_event_loop()
-    try:
-        asyncio.set_event_loop(loop)
-        return loop.run_until_complete(run_scan_active(*args, **kwargs))
-    finally:
-        try:
-            loop.run_until_complete(loop.shutdown_asyncgens())
-        except Exception:
-            pass
-        asyncio.set_event_loop(None)
-        loop.close()
+    return asyncio.run(run_scan_active(*args, **kwargs))
 
 
 __legacy__: Dict[str, Callable[..., Awaitable[Any]]] = {
@@ -4,12 +4,14 @@ Implements deterministic, fine-grained access control for evidence approval work
 Supports role hierarchies, permission caching, and audit trails.
 """
 
-from typing import Dict, Set, List, Optional, Tuple
+from typing import AbstractSet, Dict, FrozenSet, Iterable, Set, List, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 import logging
+import warnings
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
 
 
 class Role(Enum):
@@ -23,7 +25,12 @@ class Role(Enum):
 
 
 class Permission(Enum):
-    """Fine-grained permissions."""
+    """Fine-grained permissions.
+
+    Each member also carries a ``bit`` so permission sets can be checked as int masks.
+    """
+    bit: int
+    
     # Evidence operations
     READ_EVIDENCE = "read_evidence"
     PROCESS_EVIDENCE = "process_evidence"
@@ -49,7 +56,23 @@ class Permission(Enum):
     VIEW_AUDIT_LOG = "view_audit_log"
 
 
-@dataclass
+for _index, _permission in enumerate(Permission):
+    _permission.bit = 1 << _index
+del _index, _permission
+
+_ALL_PERMS: FrozenSet[Permission] = frozenset(Permission)
+_ALL_MASK = (1 << len(_ALL_PERMS)) - 1
+
+
+def _permission_mask(permissions: Iterable[Permission]) -> int:
+    """OR together the bits of ``permissions``."""
+    mask = 0
+    for permission in permissions:
+        mask |= permission.bit
+    return mask
+
+
+@dataclass(slots=True)
 class User:
     """User with role and permission assignments."""
     user_id: str
@@ -77,19 +100,19 @@ class User:
 class RolePermissionMapper:
     """Maps roles to their default permissions."""
     
-    ROLE_PERMISSIONS: Dict[Role, Set[Permission]] = {
-        Role.VIEWER: {
+    ROLE_PERMISSIONS: Dict[Role, FrozenSet[Permission]] = {
+        Role.VIEWER: frozenset({
             Permission.READ_EVIDENCE,
             Permission.VIEW_WORKFLOW,
             Permission.VIEW_HR_DATA,
-        },
-        Role.EVIDENCE_MANAGER: {
+        }),
+        Role.EVIDENCE_MANAGER: frozenset({
             Permission.READ_EVIDENCE,
             Permission.PROCESS_EVIDENCE,
             Permission.VIEW_WORKFLOW,
             Permission.VIEW_HR_DATA,
-        },
-        Role.HR_SPECIALIST: {
+        }),
+        Role.HR_SPECIALIST: frozenset({
             Permission.READ_EVIDENCE,
             Permission.PROCESS_EVIDENCE,
             Permission.APPROVE_EVIDENCE,
@@ -97,8 +120,8 @@ class RolePermissionMapper:
             Permission.VIEW_WORKFLOW,
             Permission.VIEW_HR_DATA,
             Permission.APPROVE_HR_DECISION,
-        },
-        Role.HR_MANAGER: {
+        }),
+        Role.HR_MANAGER: frozenset({
             Permission.READ_EVIDENCE,
             Permission.PROCESS_EVIDENCE,
             Permission.APPROVE_EVIDENCE,
@@ -108,34 +131,51 @@ class RolePermissionMapper:
             Permission.VIEW_HR_DATA,
             Permission.APPROVE_HR_DECISION,
             Permission.OVERRIDE_DECISION,
-        },
-        Role.COMPLIANCE_OFFICER: {
+        }),
+        Role.COMPLIANCE_OFFICER: frozenset({
             Permission.READ_EVIDENCE,
             Permission.VIEW_WORKFLOW,
             Permission.VIEW_HR_DATA,
             Permission.AUDIT_EVIDENCE,
             Permission.ENFORCE_POLICY,
             Permission.VIEW_AUDIT_LOG,
-        },
-        Role.SYSTEM_ADMIN: set(Permission),  # All permissions
+        }),
+        Role.SYSTEM_ADMIN: _ALL_PERMS,  # All permissions
     }
     
     @classmethod
-    def get_permissions_for_role(cls, role: Role) -> Set[Permission]:
-        """Get all permissions for a role."""
-        return cls.ROLE_PERMISSIONS.get(role, set()).copy()
+    def get_permissions_for_role(cls, role: Role) -> FrozenSet[Permission]:
+        """Get all permissions for a role (shared, read-only)."""
+        return cls.ROLE_PERMISSIONS.get(role, frozenset())
     
     @classmethod
-    def get_permissions_for_user(cls, user: User) -> Set[Permission]:
+    def get_permissions_for_user(cls, user: User) -> AbstractSet[Permission]:
         """Get all permissions for a user based on their roles."""
+        if Role.SYSTEM_ADMIN in user.roles:
+            return _ALL_PERMS
         permissions = set()
         for role in user.roles:
             permissions.update(cls.get_permissions_for_role(role))
         permissions.update(user.custom_permissions)
         return permissions
+    
+    @classmethod
+    def get_mask_for_user(cls, user: User) -> int:
+        """Get the user's permissions as an int mask of ``Permission.bit`` values."""
+        if Role.SYSTEM_ADMIN in user.roles:
+            return _ALL_MASK
+        mask = _permission_mask(user.custom_permissions)
+        for role in user.roles:
+            mask |= ROLE_MASKS.get(role, 0)
+        return mask
+
+
+ROLE_MASKS: Dict[Role, int] = {
+    role: _permission_mask(permissions) for role, permissions in RolePermissionMapper.ROLE_PERMISSIONS.items()
+}
 
 
-@dataclass
+@dataclass(slots=True)
 class AccessContext:
     """Context for access control decision."""
     user: User
@@ -145,13 +185,26 @@ class AccessContext:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
+# (timestamp, user_id, granted, permission value, resource_id, reason)
+AuditRecord = Tuple[datetime, str, bool, str, Optional[str], Optional[str]]
+
+# (roles, custom permissions) -> effective permission mask
+PermissionCacheKey = Tuple[FrozenSet[Role], FrozenSet[Permission]]
+
+
 class AccessControl:
     """Enforces RBAC policies with audit trails."""
     
+    PERMISSION_CACHE_SIZE = 256
+    AUDIT_LOG_SIZE = 100_000
+    
     def __init__(self):
         self.logger = logging.getLogger("AccessControl")
-        self.permission_cache: Dict[str, Set[Permission]] = {}
-        self.audit_log: List[Dict] = []
+        # Keyed by the role/permission sets rather than user_id, so users with the
+        # same roles share an entry and role changes never return stale results
+        self.permission_cache: "OrderedDict[PermissionCacheKey, int]" = OrderedDict()
+        # Oldest records drop off once the log is full; dicts are built on read
+        self.audit_log: "deque[AuditRecord]" = deque(maxlen=self.AUDIT_LOG_SIZE)
     
     def check_permission(self, context: AccessContext) -> bool:
         """Check if user has required permission.
@@ -162,17 +215,12 @@ class AccessControl:
         Returns:
             True if access is granted, False otherwise
         """
-        # Check if user is active
-        if not context.user.is_active:
+        user_mask = self._get_user_perms(context.user)
+        if user_mask is None:
             self._log_access_denial(context, "User is inactive")
             return False
         
-        # Get cached permissions or compute them
-        if context.user.user_id not in self.permission_cache:
-            self.permission_cache[context.user.user_id] = RolePermissionMapper.get_permissions_for_user(context.user)
-        
-        user_permissions = self.permission_cache[context.user.user_id]
-        has_permission = context.required_permission in user_permissions
+        has_permission = bool(user_mask & context.required_permission.bit)
         
         if has_permission:
             self._log_access_grant(context)
@@ -181,56 +229,114 @@ class AccessControl:
         
         return has_permission
     
+    def _get_user_perms(self, user: User) -> Optional[int]:
+        """Return the user's permission mask, or ``None`` if the user is inactive."""
+        if not user.is_active:
+            return None
+        # Admins hold every permission; skip the cache entirely
+        if Role.SYSTEM_ADMIN in user.roles:
+            return _ALL_MASK
+        return self._cached_permissions(user)
+    
+    def _cached_permissions(self, user: User) -> int:
+        """Return the user's permission mask from the bounded LRU cache."""
+        key = (frozenset(user.roles), frozenset(user.custom_permissions))
+        cache = self.permission_cache
+        mask = cache.get(key)
+        if mask is None:
+            mask = RolePermissionMapper.get_mask_for_user(user)
+            cache[key] = mask
+            if len(cache) > self.PERMISSION_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return mask
+    
     def check_permissions(self, context: AccessContext, required_permissions: Set[Permission]) -> bool:
-        """Check if user has ALL required permissions."""
-        for permission in required_permissions:
-            context.required_permission = permission
-            if not self.check_permission(context):
-                return False
-        return True
+        """Check if user has ALL required permissions (one audit entry for the set)."""
+        if not required_permissions:
+            return True  # vacuously true; nothing to audit
+        label = _permission_label(required_permissions)
+        user_mask = self._get_user_perms(context.user)
+        if user_mask is None:
+            self._log_access_denial(context, "User is inactive", label)
+            return False
+        required = _permission_mask(required_permissions)
+        if user_mask & required == required:
+            self._log_access_grant(context, label)
+            return True
+        self._log_access_denial(context, "Permission denied", label)
+        return False
     
     def check_any_permission(self, context: AccessContext, required_permissions: Set[Permission]) -> bool:
-        """Check if user has ANY of the required permissions."""
-        for permission in required_permissions:
-            context.required_permission = permission
-            if self.check_permission(context):
-                return True
+        """Check if user has ANY of the required permissions (one audit entry for the set)."""
+        if not required_permissions:
+            return False  # nothing to match; nothing to audit
+        label = _permission_label(required_permissions)
+        user_mask = self._get_user_perms(context.user)
+        if user_mask is None:
+            self._log_access_denial(context, "User is inactive", label)
+            return False
+        if user_mask & _permission_mask(required_permissions):
+            self._log_access_grant(context, label)
+            return True
+        self._log_access_denial(context, "Permission denied", label)
         return False
     
-    def _log_access_grant(self, context: AccessContext):
+    def _log_access_grant(self, context: AccessContext, permission: Optional[str] = None):
         """Log successful access."""
-        log_entry = {
-            "timestamp": context.timestamp.isoformat(),
-            "user_id": context.user.user_id,
-            "action": "GRANT",
-            "permission": context.required_permission.value,
-            "resource_id": context.resource_id,
-        }
-        self.audit_log.append(log_entry)
-        self.logger.info(f"Access granted: {context.user.user_id} - {context.required_permission.value}")
+        permission = permission or context.required_permission.value
+        self.audit_log.append(
+            (context.timestamp, context.user.user_id, True, permission, context.resource_id, None)
+        )
+        self.logger.info("Access granted: %s - %s", context.user.user_id, permission)
     
-    def _log_access_denial(self, context: AccessContext, reason: str):
+    def _log_access_denial(self, context: AccessContext, reason: str, permission: Optional[str] = None):
         """Log access denial."""
-        log_entry = {
-            "timestamp": context.timestamp.isoformat(),
-            "user_id": context.user.user_id,
-            "action": "DENY",
-            "permission": context.required_permission.value,
-            "resource_id": context.resource_id,
-            "reason": reason,
-        }
-        self.audit_log.append(log_entry)
-        self.logger.warning(f"Access denied: {context.user.user_id} - {context.required_permission.value} - {reason}")
+        permission = permission or context.required_permission.value
+        self.audit_log.append(
+            (context.timestamp, context.user.user_id, False, permission, context.resource_id, reason)
+        )
+        self.logger.warning("Access denied: %s - %s - %s", context.user.user_id, permission, reason)
     
     def invalidate_user_cache(self, user_id: str):
-        """Invalidate cached permissions for a user."""
-        self.permission_cache.pop(user_id, None)
+        """Deprecated: cached permissions can no longer go stale.
+
+        The cache is keyed by role and permission sets, so revoking a role or
+        custom permission already makes the next check miss the cache.
+        """
+        warnings.warn(
+            "AccessControl.invalidate_user_cache is deprecated and has no effect: "
+            "role and permission changes are picked up on the next check",
+            DeprecationWarning,
+            stacklevel=2,
+        )
     
     def get_audit_trail(self, user_id: Optional[str] = None) -> List[Dict]:
         """Get audit trail of access attempts."""
         if user_id:
-            return [log for log in self.audit_log if log["user_id"] == user_id]
-        return self.audit_log.copy()
+            return [format_audit_entry(log) for log in self.audit_log if log[1] == user_id]
+        return [format_audit_entry(log) for log in self.audit_log]
+
+
+def _permission_label(permissions: AbstractSet[Permission]) -> str:
+    """Name a set of permissions in one audit entry, e.g. ``"approve_evidence,read_evidence"``."""
+    return ",".join(sorted(permission.value for permission in permissions))
+
+
+def format_audit_entry(record: AuditRecord) -> Dict:
+    """Expand an audit record into a dict with an ISO timestamp."""
+    timestamp, user_id, granted, permission, resource_id, reason = record
+    entry = {
+        "timestamp": timestamp.isoformat(),
+        "user_id": user_id,
+        "action": "GRANT" if granted else "DENY",
+        "permission": permission,
+        "resource_id": resource_id,
+    }
+    if not granted:
+        entry["reason"] = reason
+    return entry
 
 
 if __name__ == "__main__":
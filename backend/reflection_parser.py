@@ -5,12 +5,96 @@ Extracts insights from approval decisions and generates structured feedback.
 Supports HTML form generation and deterministic decision analysis.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Sequence, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+from array import array
 from datetime import datetime
+import itertools
 import logging
+import operator
 import json
+import uuid
+
+import jinja2
+
+try:  # C escaping for autoescaped form text; pure Python otherwise
+    from markupsafe import _speedups  # type: ignore  # noqa: F401
+except Exception:  # pragma: no cover - depends on the installed wheel
+    logging.getLogger("ReflectionParser").warning(
+        "markupsafe C speedups unavailable; form HTML escaping runs in pure Python"
+    )
+
+try:  # vectorised batch classification
+    import numpy as np
+except Exception:  # pragma: no cover - optional dependency
+    np = None  # type: ignore
+
+# Below this many decisions the NumPy setup costs more than it saves.
+VECTORIZE_THRESHOLD = 256
+
+
+_MACROS_SRC = """\
+{% macro question(q) %}
+        <div class="form-group">
+            <label>{{ q.text }}</label>
+{% if q.type == 'textarea' %}
+            <textarea name="{{ q.name }}"{% if q.required %} required{% endif %}></textarea>
+{% elif q.type == 'rating' %}
+            <input type="range" min="1" max="5" name="{{ q.name }}" />
+{% elif q.type == 'text' %}
+            <input type="text" name="{{ q.name }}"{% if q.required %} required{% endif %} />
+{% elif q.type == 'multiple_choice' %}
+            <select name="{{ q.name }}"{% if q.required %} required{% endif %}>
+{% for option in q.options %}
+                <option>{{ option }}</option>
+{% endfor %}
+            </select>
+{% endif %}
+        </div>
+{% endmacro %}"""
+
+_SECTIONS_SRC = """\
+{% from "reflection_macros.html" import question %}
+{% for section in sections %}
+    <fieldset>
+        <legend>{{ section.title }}</legend>
+        <p>{{ section.description }}</p>
+{% for q in section.questions %}
+{{ question(q) }}
+{%- endfor %}
+    </fieldset>
+{% endfor %}
+"""
+
+_FORM_SRC = """\
+{% from "reflection_macros.html" import question %}
+<form id="{{ form_id }}" class="reflection-form">
+    <h2>{{ title }}</h2>
+    <p>{{ description }}</p>
+{% block sections %}{% include "reflection_sections.html" %}{% endblock %}
+{% for q in extra_questions %}
+{{ question(q) }}
+{%- endfor %}
+    <button type="submit">Submit Feedback</button>
+</form>"""
+
+_FORM_TEMPLATE_NAME = "reflection_form.html"
+
+# One environment shared by every form; its template cache keeps the compiled
+# code, so to_html only ever renders
+_ENV = jinja2.Environment(
+    loader=jinja2.DictLoader({
+        "reflection_macros.html": _MACROS_SRC,
+        "reflection_sections.html": _SECTIONS_SRC,
+        _FORM_TEMPLATE_NAME: _FORM_SRC,
+    }),
+    autoescape=True,
+    trim_blocks=True,
+    lstrip_blocks=True,
+    cache_size=400,
+)
+_FORM_TEMPLATE = _ENV.get_template(_FORM_TEMPLATE_NAME)
 
 
 class DecisionCategory(Enum):
@@ -23,6 +107,83 @@ class DecisionCategory(Enum):
     DECISION_TIME = "decision_time"
 
 
+_ESCALATION_PATTERNS_VALUE = DecisionCategory.ESCALATION_PATTERNS.value
+
+# Indexed by classification: escalated, slow (> 1 hour), low confidence, otherwise
+_CATEGORIES: Tuple[DecisionCategory, ...] = (
+    DecisionCategory.ESCALATION_PATTERNS,
+    DecisionCategory.DECISION_TIME,
+    DecisionCategory.APPROVER_CONFIDENCE,
+    DecisionCategory.WORKFLOW_EFFICIENCY,
+)
+_DESCRIPTIONS: Tuple[str, ...] = (
+    "Decision required escalation - may indicate complexity",
+    "Extended decision time - may need process optimization",
+    "Lower confidence score - may need more evidence",
+    "Efficient decision with good confidence",
+)
+# One C call for the common case where a decision carries all three fields
+_GET_DECISION_FIELDS = operator.itemgetter('approval_time', 'confidence', 'escalated')
+
+_CATEGORY_INDEX: Dict[DecisionCategory, int] = {category: idx for idx, category in enumerate(_CATEGORIES)}
+
+# Fixed sections per category as (title, description, questions)
+_CATEGORY_SECTIONS: Dict[DecisionCategory, Tuple[Tuple[str, str, Tuple[Dict[str, Any], ...]], ...]] = {
+    DecisionCategory.EVIDENCE_QUALITY: ((
+        "Evidence Assessment",
+        "How would you rate the quality of evidence in this workflow?",
+        (
+            {"text": "Was the evidence clear and relevant?", "type": "rating"},
+            {"text": "Suggestions for improvement:", "type": "textarea"},
+        ),
+    ),),
+    DecisionCategory.WORKFLOW_EFFICIENCY: ((
+        "Process Efficiency",
+        "How efficient was this approval workflow?",
+        (
+            {"text": "Decision time was appropriate", "type": "rating"},
+            {"text": "Process suggestions:", "type": "textarea"},
+        ),
+    ),),
+    DecisionCategory.ESCALATION_PATTERNS: ((
+        "Escalation Analysis",
+        "Was the escalation necessary and handled well?",
+        (
+            {"text": "Escalation was justified", "type": "rating"},
+            {"text": "Escalation details:", "type": "textarea"},
+        ),
+    ),),
+}
+
+
+def _section_dicts(category: DecisionCategory) -> List[Dict[str, Any]]:
+    """Fresh copies of a category's sections in the shape ``add_section`` stores."""
+    return [
+        {"title": title, "description": description, "questions": [dict(q) for q in questions]}
+        for title, description, questions in _CATEGORY_SECTIONS.get(category, ())
+    ]
+
+
+def _specialize_form_template(sections: List[Dict[str, Any]]) -> jinja2.Template:
+    """Compile a form template with ``sections`` pre-rendered as static HTML.
+
+    The per-question type dispatch runs once here instead of on every render.
+    """
+    static = _ENV.get_template("reflection_sections.html").render(sections=sections)
+    return _ENV.from_string(
+        '{% extends "reflection_form.html" %}{% block sections %}{% raw %}'
+        + static
+        + "{% endraw %}{% endblock %}"
+    )
+
+
+# category value -> (sections the template was built from, specialized template)
+_CATEGORY_TEMPLATES: Dict[str, Tuple[List[Dict[str, Any]], jinja2.Template]] = {
+    category.value: (_section_dicts(category), _specialize_form_template(_section_dicts(category)))
+    for category in DecisionCategory
+}
+
+
 class FeedbackType(Enum):
     """Types of feedback generated from decisions."""
     IMPROVEMENT = "improvement"
@@ -73,33 +234,33 @@ class ReflectionForm:
             "questions": questions or []
         })
     
+    def _render_ctx(self) -> Tuple[jinja2.Template, Dict[str, Any]]:
+        """Pick the template for this form and the variables to render it with.
+
+        Forms generated for a category whose sections are unchanged use that
+        category's pre-rendered template; anything else renders generically.
+        """
+        ctx: Dict[str, Any] = {
+            "form_id": self.form_id,
+            "title": self.title,
+            "description": self.description,
+            "extra_questions": self.questions,
+        }
+        specialized = _CATEGORY_TEMPLATES.get(self.metadata.get("category"))
+        if specialized is not None and self.sections == specialized[0]:
+            return specialized[1], ctx
+        ctx["sections"] = self.sections
+        return _FORM_TEMPLATE, ctx
+    
     def to_html(self) -> str:
         """Generate HTML representation of form."""
-        html = f"""<form id="{self.form_id}" class="reflection-form">
-    <h2>{self.title}</h2>
-    <p>{self.description}</p>
-"""
-        
-        for section in self.sections:
-            html += f"""    <fieldset>
-        <legend>{section['title']}</legend>
-        <p>{section['description']}</p>
-"""
-            for q in section['questions']:
-                html += f"""        <div class="form-group">
-            <label>{q.get('text', '')}</label>
-"""
-                if q.get('type') == 'textarea':
-                    html += f"""            <textarea name="{q.get('name', '')}" required="{q.get('required', False)}"></textarea>
-"""
-                elif q.get('type') == 'rating':
-                    html += f"""            <input type="range" min="1" max="5" name="{q.get('name', '')}" />
-"""
-                html += "        </div>\n"
-            html += "    </fieldset>\n"
-        
-        html += "    <button type="submit">Submit Feedback</button>\n</form>"
-        return html
+        template, ctx = self._render_ctx()
+        return template.render(**ctx)
+    
+    def to_html_stream(self) -> Iterator[str]:
+        """Yield the form HTML piece by piece, e.g. for a streaming response."""
+        template, ctx = self._render_ctx()
+        yield from template.generate(**ctx)
 
 
 class ReflectionParser:
@@ -107,60 +268,121 @@ class ReflectionParser:
     
     def __init__(self):
         self.logger = logging.getLogger("ReflectionParser")
-        self.insights: List[DecisionInsight] = []
+        # Insights are stored column-wise; DecisionInsight objects are only built
+        # when read. "category" holds an index into _CATEGORIES/_DESCRIPTIONS.
+        self._insight_cols: Dict[str, Any] = {
+            "decision_id": [],
+            "category": array('b'),
+            "approval_time": [],
+            "confidence": [],
+            "confidence_level": [],
+            "was_escalated": [],
+            "generated_at": [],
+        }
         self.forms_generated: List[ReflectionForm] = []
         self.analysis_history: List[Dict] = []
     
-    def analyze_decision(self, decision: Dict) -> Optional[DecisionInsight]:
+    def analyze_decision(self, decision: Dict, ts: Optional[str] = None) -> Optional[DecisionInsight]:
         """Extract insight from approval decision.
         
         Args:
             decision: Decision record with metadata
+            ts: Optional shared audit timestamp for batch callers
             
         Returns:
             DecisionInsight or None if analysis fails
         """
         try:
             # Analyze decision factors
-            approval_time = decision.get('approval_time', 0)
-            confidence = decision.get('confidence', 70)
-            was_escalated = decision.get('escalated', False)
+            try:
+                approval_time, confidence, was_escalated = _GET_DECISION_FIELDS(decision)
+            except KeyError:
+                approval_time = decision.get('approval_time', 0)
+                confidence = decision.get('confidence', 70)
+                was_escalated = decision.get('escalated', False)
             
-            # Determine insight category
-            if was_escalated:
-                category = DecisionCategory.ESCALATION_PATTERNS
-                description = "Decision required escalation - may indicate complexity"
-            elif approval_time > 3600:  # > 1 hour
-                category = DecisionCategory.DECISION_TIME
-                description = "Extended decision time - may need process optimization"
-            elif confidence < 70:
-                category = DecisionCategory.APPROVER_CONFIDENCE
-                description = "Lower confidence score - may need more evidence"
-            else:
-                category = DecisionCategory.WORKFLOW_EFFICIENCY
-                description = "Efficient decision with good confidence"
+            # Index into _CATEGORIES/_DESCRIPTIONS; > 1 hour counts as slow
+            idx = 0 if was_escalated else 1 if approval_time > 3600 else 2 if confidence < 70 else 3
+            # Computed before storing so a non-numeric confidence leaves no row behind
+            confidence_level = min(95, max(50, confidence))
             
-            insight = DecisionInsight(
-                decision_id=decision.get('id', 'unknown'),
-                category=category,
-                insight_type="automatic_analysis",
-                description=description,
-                metrics={
-                    "approval_time_seconds": approval_time,
-                    "confidence_score": confidence,
-                    "was_escalated": was_escalated
-                },
-                confidence_level=min(95, max(50, confidence))
+            row = self._record_insight(
+                decision.get('id', 'unknown'), idx, approval_time, confidence, confidence_level, was_escalated, ts
             )
-            
-            self.insights.append(insight)
-            self._log_analysis("ANALYZED", decision.get('id', 'unknown'))
-            return insight
+            return self._insight_at(row)
             
         except Exception as e:
             self.logger.error(f"Analysis failed: {str(e)}")
             return None
     
+    def _record_insight(
+        self,
+        decision_id: str,
+        category_idx: int,
+        approval_time: Any,
+        confidence: Any,
+        confidence_level: Any,
+        was_escalated: Any,
+        ts: Optional[str],
+        generated_at: Optional[datetime] = None,
+    ) -> int:
+        """Store and audit-log the insight for one classified decision; returns its row."""
+        cols = self._insight_cols
+        cols["decision_id"].append(decision_id)
+        cols["category"].append(category_idx)
+        cols["approval_time"].append(approval_time)
+        cols["confidence"].append(confidence)
+        cols["confidence_level"].append(confidence_level)
+        cols["was_escalated"].append(was_escalated)
+        cols["generated_at"].append(generated_at or datetime.now())
+        self._log_analysis("ANALYZED", decision_id, ts)
+        return len(cols["decision_id"]) - 1
+    
+    def _insight_at(self, row: int) -> DecisionInsight:
+        """Build the DecisionInsight view of one stored row."""
+        cols = self._insight_cols
+        idx = cols["category"][row]
+        return DecisionInsight(
+            decision_id=cols["decision_id"][row],
+            category=_CATEGORIES[idx],
+            insight_type="automatic_analysis",
+            description=_DESCRIPTIONS[idx],
+            metrics={
+                "approval_time_seconds": cols["approval_time"][row],
+                "confidence_score": cols["confidence"][row],
+                "was_escalated": cols["was_escalated"][row]
+            },
+            confidence_level=cols["confidence_level"][row],
+            generated_at=cols["generated_at"][row],
+        )
+    
+    @property
+    def insights(self) -> List[DecisionInsight]:
+        """All insights so far, built fresh from the stored columns."""
+        return [self._insight_at(row) for row in range(len(self._insight_cols["decision_id"]))]
+    
+    def _classify_batch(self, decisions: Sequence[Dict]) -> Optional[Tuple[List[Tuple[Any, Any, Any]], Any]]:
+        """Classify every decision at once with NumPy.
+
+        Returns the raw ``(approval_time, confidence, escalated)`` fields and an
+        index into ``_CATEGORIES`` per decision, or ``None`` when the batch has
+        anything the per-decision path would reject (non-dicts, non-numeric
+        values), so that path can handle and log it.
+        """
+        try:
+            fields = [
+                (d.get('approval_time', 0), d.get('confidence', 70), d.get('escalated', False)) for d in decisions
+            ]
+            times = np.array([f[0] for f in fields])
+            conf = np.array([f[1] for f in fields])
+        except Exception:
+            return None
+        if times.dtype.kind not in "biuf" or conf.dtype.kind not in "biuf":
+            return None
+        esc = np.fromiter((bool(f[2]) for f in fields), dtype=np.bool_, count=len(fields))
+        cat_idx = np.select([esc, times > 3600, conf < 70], [0, 1, 2], default=3)
+        return fields, cat_idx
+    
     def generate_feedback_form(self, decision_category: DecisionCategory, title: str) -> ReflectionForm:
         """Generate structured feedback form for category.
         
@@ -172,40 +394,13 @@ class ReflectionParser:
             ReflectionForm with questions and sections
         """
         form = ReflectionForm(
-            form_id=f"form_{decision_category.value}_{datetime.now().timestamp()}",
+            form_id=f"form_{decision_category.value}_{uuid.uuid4().hex}",
             title=title,
             description=f"Feedback form for {decision_category.value} decisions"
         )
         
-        if decision_category == DecisionCategory.EVIDENCE_QUALITY:
-            form.add_section(
-                "Evidence Assessment",
-                "How would you rate the quality of evidence in this workflow?",
-                [
-                    {"text": "Was the evidence clear and relevant?", "type": "rating"},
-                    {"text": "Suggestions for improvement:", "type": "textarea"}
-                ]
-            )
-        
-        elif decision_category == DecisionCategory.WORKFLOW_EFFICIENCY:
-            form.add_section(
-                "Process Efficiency",
-                "How efficient was this approval workflow?",
-                [
-                    {"text": "Decision time was appropriate", "type": "rating"},
-                    {"text": "Process suggestions:", "type": "textarea"}
-                ]
-            )
-        
-        elif decision_category == DecisionCategory.ESCALATION_PATTERNS:
-            form.add_section(
-                "Escalation Analysis",
-                "Was the escalation necessary and handled well?",
-                [
-                    {"text": "Escalation was justified", "type": "rating"},
-                    {"text": "Escalation details:", "type": "textarea"}
-                ]
-            )
+        form.metadata["category"] = decision_category.value
+        form.sections.extend(_section_dicts(decision_category))
         
         form.add_question(
             "text",
@@ -226,8 +421,10 @@ class ReflectionParser:
         Returns:
             Analysis summary with insights and patterns
         """
+        batch_at = datetime.now()
+        batch_ts = batch_at.isoformat()
         results = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": batch_ts,
             "total_decisions": len(decisions),
             "insights_generated": 0,
             "by_category": {},
@@ -235,19 +432,43 @@ class ReflectionParser:
             "recommendations": []
         }
         
-        category_counts = {}
+        classified = None
+        if np is not None and len(decisions) >= VECTORIZE_THRESHOLD:
+            classified = self._classify_batch(decisions)
         
-        for decision in decisions:
-            insight = self.analyze_decision(decision)
-            if insight:
-                results["insights_generated"] += 1
-                category = insight.category.value
-                category_counts[category] = category_counts.get(category, 0) + 1
+        if classified is not None:
+            fields, cat_idx = classified
+            decision_ids = [decision.get('id', 'unknown') for decision in decisions]
+            cols = self._insight_cols
+            cols["decision_id"].extend(decision_ids)
+            cols["category"].frombytes(cat_idx.astype(np.int8).tobytes())
+            cols["approval_time"].extend(f[0] for f in fields)
+            cols["confidence"].extend(f[1] for f in fields)
+            cols["confidence_level"].extend(min(95, max(50, f[1])) for f in fields)
+            cols["was_escalated"].extend(f[2] for f in fields)
+            cols["generated_at"].extend(itertools.repeat(batch_at, len(decisions)))
+            for decision_id in decision_ids:
+                self._log_analysis("ANALYZED", decision_id, batch_ts)
+            counts = np.bincount(cat_idx, minlength=len(_CATEGORIES))
+            present, first_seen = np.unique(cat_idx, return_index=True)
+            # Same key order as the loop below: categories in order of first appearance
+            category_counts = {
+                _CATEGORIES[idx].value: int(counts[idx]) for idx in present[np.argsort(first_seen)].tolist()
+            }
+            results["insights_generated"] = len(decisions)
+        else:
+            category_counts = {}
+            for decision in decisions:
+                insight = self.analyze_decision(decision, batch_ts)
+                if insight:
+                    results["insights_generated"] += 1
+                    category = insight.category.value
+                    category_counts[category] = category_counts.get(category, 0) + 1
         
         results["by_category"] = category_counts
         
         # Detect patterns
-        if category_counts.get(DecisionCategory.ESCALATION_PATTERNS.value, 0) > len(decisions) * 0.3:
+        if category_counts.get(_ESCALATION_PATTERNS_VALUE, 0) > len(decisions) * 0.3:
             results["patterns_detected"].append(
                 "High escalation rate - may indicate process complexity"
             )
@@ -255,7 +476,7 @@ class ReflectionParser:
                 "Review evidence requirements and approver training"
             )
         
-        self._log_analysis("BATCH_ANALYSIS_COMPLETE", f"Processed {len(decisions)} decisions")
+        self._log_analysis("BATCH_ANALYSIS_COMPLETE", f"Processed {len(decisions)} decisions", batch_ts)
         return results
     
     def get_insights_by_category(self, category: DecisionCategory) -> List[DecisionInsight]:
@@ -267,20 +488,31 @@ class ReflectionParser:
         Returns:
             List of DecisionInsight objects
         """
-        return [i for i in self.insights if i.category == category]
+        idx = _CATEGORY_INDEX.get(category)
+        if idx is None:
+            return []
+        column = self._insight_cols["category"]
+        if np is not None:
+            rows = np.flatnonzero(np.frombuffer(column, dtype=np.int8) == idx).tolist() if column else []
+        else:
+            rows = [row for row, value in enumerate(column) if value == idx]
+        return [self._insight_at(row) for row in rows]
     
-    def _log_analysis(self, action: str, details: str):
-        """Log analysis action for audit trail."""
+    def _log_analysis(self, action: str, details: str, ts: Optional[str] = None):
+        """Log analysis action for audit trail.
+
+        Callers logging many actions in a tight loop can pass a shared ``ts``.
+        """
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": ts or datetime.now().isoformat(),
             "action": action,
             "details": details
         }
         self.analysis_history.append(log_entry)
     
-    def get_analysis_history(self) -> List[Dict]:
-        """Get complete analysis audit trail."""
-        return self.analysis_history.copy()
+    def get_analysis_history(self) -> Tuple[Dict, ...]:
+        """Get complete analysis audit trail as a read-only snapshot."""
+        return tuple(self.analysis_history)
 
 
 if __name__ == "__main__":
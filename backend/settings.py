@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import os
-from typing import Any
+
+_TRUTHY: frozenset[str] = frozenset(("1", "true", "yes", "on"))
 
 
 def env_flag(name: str, default: bool = False) -> bool:
@@ -13,10 +14,10 @@ def env_flag(name: str, default: bool = False) -> bool:
     value falls back to ``False`` so the safer path is taken by default.
     """
 
-    raw: Any = os.getenv(name)
+    raw = os.environ.get(name)
     if raw is None:
         return bool(default)
-    return str(raw).strip().lower() in {"1", "true", "yes", "on"}
+    return raw.strip().lower() in _TRUTHY
 
 
 # Disable the agent and bridge features by default until explicitly enabled.
@@ -0,0 +1,193 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend import evidence_transformer
+from backend.evidence_transformer import EvidenceTransformer
+
+
+KPA_CONFIG = {
+    "KPA1": ["lecture", "assessment", "Lecture", ["moderation", 2.0]],
+    "KPA2": [["research", 1.0], ["publication", 1.0], ["research", 1.0]],
+}
+
+TIER_KEYWORDS = {
+    "Transformational": ["award", "award", "national recognition"],
+    "Compliance": ["attendance register"],
+}
+
+POLICY_REGISTRY = {
+    "1P_1": {"title": "Ethics Policy", "must_pass": True, "keywords": ["ethics", "Ethics", "consent"]},
+    "10P_10.4": {"title": "Community Engagement Policy", "must_pass": False, "keywords": ["community"]},
+}
+
+
+def _make_transformer(tmp_path: Path) -> EvidenceTransformer:
+    kpa_path = tmp_path / "kpa.json"
+    tier_path = tmp_path / "tiers.json"
+    policy_path = tmp_path / "policies.json"
+    kpa_path.write_text(json.dumps(KPA_CONFIG), encoding="utf-8")
+    tier_path.write_text(json.dumps(TIER_KEYWORDS), encoding="utf-8")
+    policy_path.write_text(json.dumps(POLICY_REGISTRY), encoding="utf-8")
+    return EvidenceTransformer(str(kpa_path), str(tier_path), str(policy_path))
+
+
+@pytest.fixture
+def transformer(tmp_path: Path) -> EvidenceTransformer:
+    return _make_transformer(tmp_path)
+
+
+def test_tier_and_policy_keywords_are_deduplicated_on_load(transformer):
+    assert [k for k, _ in transformer.kpa_keywords["KPA1"]] == ["lecture", "assessment", "Lecture", "moderation"]
+    assert [k for k, _ in transformer.kpa_keywords["KPA2"]] == ["research", "publication", "research"]
+    assert transformer.tier_keywords["Transformational"] == ["award", "national recognition"]
+    assert transformer.policy_registry["1P_1"]["keywords"] == ["ethics", "consent"]
+
+
+def test_transform_classifies_kpa_tier_and_policies(transformer):
+    item = {
+        "source": "outlook",
+        "title": "Research ethics award",
+        "body": "Publication submitted after ethics consent was granted",
+    }
+
+    out = transformer.transform(item)
+
+    assert out["kpa"] == ["KPA2"]
+    assert out["kpa_scores"] == {"KPA2": 1.0}
+    assert out["tier"] == ["Transformational"]
+    assert out["policy_hits"] == ["1P_1"]
+    assert out["must_pass_risks"] == ["1P_1"]
+    assert out["confidence"] == 1.0
+    assert out["_transformed"] is True
+
+
+def test_transform_marks_repeat_items_as_duplicates(transformer):
+    item = {"source": "onedrive", "path": "/docs/lecture.pdf", "title": "Lecture notes"}
+
+    first = transformer.transform(item)
+    second = transformer.transform(dict(item))
+
+    assert "_duplicate" not in first
+    assert second["_duplicate"] is True
+    assert second["hash"] == first["hash"]
+
+
+def test_untagged_items_default_to_developmental(transformer):
+    out = transformer.transform({"title": "Staff meeting"})
+
+    assert out["kpa"] == []
+    assert out["tier"] == ["Developmental"]
+    assert out["confidence"] == 0.0
+
+
+def test_compute_hash_separates_field_boundaries(transformer):
+    left = transformer._compute_hash({"source": "ab", "path": ""})
+    right = transformer._compute_hash({"source": "a", "path": "b"})
+
+    assert left != right
+    assert 0 <= left < 2**64
+
+
+def test_transform_reports_hash_as_hex_and_tracks_int_keys(transformer):
+    out = transformer.transform({"source": "drive", "title": "Lecture notes"})
+
+    assert len(out["hash"]) == 16
+    assert transformer.seen_hashes == {int(out["hash"], 16)}
+
+    again = transformer.transform({"title": "Re-fed duplicate", "hash": out["hash"]})
+    supplied = transformer.transform({"title": "Scanner item", "hash": "a" * 40})
+
+    assert again["_duplicate"] is True
+    assert supplied["hash"] == "a" * 40
+    assert "_duplicate" not in supplied
+
+
+def test_kpa_scores_are_normalised_per_kpa(transformer):
+    scores = transformer._classify_kpa("lecture moderation and research publication")
+
+    assert scores == [("KPA1", 1.0), ("KPA2", 1.0)]
+
+
+def test_repeated_kpa_keywords_keep_their_configured_weight(transformer):
+    # Same arithmetic as scoring each configured keyword with a substring check
+    assert transformer._classify_kpa("research") == [("KPA2", 2.0 / 3)]
+    assert transformer._classify_kpa("lecture") == [("KPA1", 2.0 / 4)]
+
+
+def test_parallel_batch_transform_flags_cross_chunk_duplicates(transformer, monkeypatch):
+    monkeypatch.setattr(evidence_transformer, "PARALLEL_THRESHOLD", 0)
+    items = [{"source": "drive", "title": f"Lecture {i % 6}"} for i in range(12)]
+    transformer.transform({"source": "drive", "title": "Lecture 5"})
+
+    parallel = transformer.batch_transform(items, n_workers=2)
+
+    flags = [bool(out.get("_duplicate")) for out in parallel]
+    assert flags == [False] * 5 + [True] * 7
+    assert parallel[0]["kpa"] == ["KPA1"]
+
+
+def test_batch_transform_stays_in_process_unless_workers_requested(transformer, monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool started")
+
+    monkeypatch.setattr(evidence_transformer, "PARALLEL_THRESHOLD", 0)
+    monkeypatch.setattr(evidence_transformer, "ProcessPoolExecutor", no_pool)
+
+    results = transformer.batch_transform([{"title": f"Lecture {i}"} for i in range(4)])
+
+    assert [out["kpa"] for out in results] == [["KPA1"]] * 4
+
+
+def test_batch_transform_shares_one_timestamp(transformer):
+    items = [{"title": "Lecture notes"}, {"title": "Research output"}, "not-a-dict"]
+
+    results = transformer.batch_transform(items)
+
+    stamps = {out["_transform_timestamp"] for out in results}
+    assert len(stamps) == 1
+
+
+def test_compiled_keywords_match_plain_substring_checks():
+    keywords = ["ab", "abc", "bc", "c", "a-b", "research", "research output", "search", "(c)"]
+    pattern, expansions = evidence_transformer._compile_keywords(keywords)
+    texts = ["abc", "xa-bcx", "research output 2024", "searches", "(c) staff", "nothing here", ""]
+
+    for text in texts:
+        found = evidence_transformer._find_keywords(pattern, expansions, text)
+        assert found == {k for k in keywords if k in text}, text
+
+
+def test_transform_in_place_reuses_the_input_dict(transformer):
+    item = {"source": "outlook", "title": "Research publication", "body": "x" * 1000}
+    copy_out = transformer.transform(dict(item, source="drive"))
+    assert "kpa" not in item
+
+    out = transformer.transform(item, in_place=True)
+
+    assert out is item
+    assert item["kpa"] == copy_out["kpa"] == ["KPA2"]
+
+
+def test_category_names_are_shared_across_outputs(transformer):
+    first = transformer.transform({"title": "Research ethics award"})
+    second = transformer.transform({"title": "Publication ethics award"})
+
+    assert first["kpa"][0] is second["kpa"][0]
+    assert first["tier"][0] is second["tier"][0]
+    assert first["policy_hits"][0] is second["policy_hits"][0]
+
+
+def test_classify_kpa_keeps_only_top_k(transformer):
+    text = "lecture moderation research"
+
+    assert transformer._classify_kpa(text) == [("KPA1", 1.0), ("KPA2", 2.0 / 3)]
+
+    transformer.top_k = 1
+    assert transformer._classify_kpa(text) == [("KPA1", 1.0)]
@@ -0,0 +1,128 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.hr_approval_layer import (
+    ApprovalRule,
+    ApprovalStatus,
+    ApprovalWorkflow,
+    EvidenceDecision,
+)
+
+
+def test_rule_conditions_cover_all_operators():
+    rule = ApprovalRule("trusted_policy_docs", "auto_approve")
+    rule.add_condition("confidence", "gt", 0.8)
+    rule.add_condition("risk", "lt", 3)
+    rule.add_condition("kpa", "eq", "KPA1")
+    rule.add_condition("tags", "contains", "policy")
+    rule.add_condition("source", "in", ("outlook", "onedrive"))
+
+    context = {"confidence": 0.9, "risk": 1, "kpa": "KPA1", "tags": ["policy"], "source": "outlook"}
+    assert rule.evaluate(context) is True
+    assert rule.evaluate({**context, "tags": []}) is False
+    assert rule.evaluate({**context, "source": "drive"}) is False
+
+    rule.enabled = False
+    assert rule.evaluate(context) is False
+
+
+def test_unknown_operator_never_matches():
+    rule = ApprovalRule("odd", "auto_reject")
+    rule.add_condition("confidence", "between", (0, 1))
+
+    assert rule.evaluate({"confidence": 0.5}) is False
+
+
+def test_auto_approval_and_rejection_rules():
+    workflow = ApprovalWorkflow()
+    approve = ApprovalRule("high_confidence", "auto_approve")
+    approve.add_condition("confidence", "gt", 0.8)
+    reject = ApprovalRule("no_evidence", "auto_reject")
+    reject.add_condition("confidence", "lt", 0.2)
+    workflow.add_approval_rule(approve)
+    workflow.add_approval_rule(reject)
+
+    assert workflow.evaluate_auto_approval("r1", {"confidence": 0.9}) == EvidenceDecision.APPROVED_FOR_HR_USE
+    assert workflow.evaluate_auto_approval("r2", {"confidence": 0.1}) == EvidenceDecision.INSUFFICIENT_EVIDENCE
+    assert workflow.evaluate_auto_approval("r3", {"confidence": 0.5}) is None
+    assert [entry["action"] for entry in workflow.get_audit_trail()] == ["AUTO_APPROVED", "AUTO_REJECTED"]
+
+
+def test_approval_flow_updates_status():
+    workflow = ApprovalWorkflow()
+    workflow.approval_chain["policy"] = ["hr_specialist", "hr_manager"]
+    request = workflow.create_approval_request("policy_001", "policy", "evidence_manager_1")
+
+    assert workflow.get_pending_requests("hr_specialist") == [request]
+
+    workflow.submit_approval(request.request_id, "hr_specialist", EvidenceDecision.APPROVED_FOR_HR_USE)
+
+    assert request.status == ApprovalStatus.APPROVED
+    assert workflow.get_pending_requests("hr_specialist") == []
+
+
+def test_rules_are_bucketed_by_type():
+    workflow = ApprovalWorkflow()
+    escalate = ApprovalRule("route_up", "escalate")
+    escalate.add_condition("confidence", "gt", 0.0)
+    workflow.add_approval_rule(escalate)
+
+    assert workflow.rules_by_type["escalate"] == [escalate]
+    assert workflow.evaluate_auto_approval("r1", {"confidence": 0.9}) is None
+
+
+def test_rules_list_and_first_match_order_are_kept():
+    workflow = ApprovalWorkflow()
+    reject = ApprovalRule("flagged", "auto_reject")
+    reject.add_condition("flagged", "eq", True)
+    approve = ApprovalRule("confident", "auto_approve")
+    approve.add_condition("confidence", "gt", 0.8)
+    workflow.add_approval_rule(reject)
+    workflow.add_approval_rule(approve)
+
+    assert workflow.rules == (reject, approve)
+    with pytest.raises(AttributeError):
+        workflow.rules.append(reject)
+    assert workflow.evaluate_auto_approval("r1", {"confidence": 0.9, "flagged": True}) == (
+        EvidenceDecision.INSUFFICIENT_EVIDENCE
+    )
+
+
+def test_pending_index_follows_routing_rejection_and_escalation():
+    workflow = ApprovalWorkflow()
+    workflow.approval_chain["policy"] = ["hr_specialist"]
+    critical = workflow.create_approval_request("policy_001", "policy", "manager")
+    critical.priority = 1
+    rejected = workflow.create_approval_request("policy_002", "policy", "manager")
+    escalated = workflow.create_approval_request("policy_003", "policy", "manager")
+
+    assert workflow.get_pending_requests("hr_specialist") == [critical, rejected, escalated]
+
+    workflow.approval_chain["policy"] = ["hr_director"]
+    workflow.submit_approval(critical.request_id, "hr_specialist", EvidenceDecision.APPROVED_FOR_HR_USE)
+    workflow.submit_rejection(rejected.request_id, "hr_specialist", "Missing signature")
+    workflow.escalate_request(escalated.request_id, "Conflict of interest")
+
+    assert workflow.get_pending_requests("hr_specialist") == []
+    assert workflow.get_pending_requests("hr_director") == [critical]
+    assert workflow.get_pending_requests("hr_manager") == []
+
+
+def test_audit_trail_filters_by_request():
+    workflow = ApprovalWorkflow()
+    first = workflow.create_approval_request("ev_1", "policy", "manager")
+    second = workflow.create_approval_request("ev_2", "policy", "manager")
+    workflow.submit_rejection(first.request_id, "hr_specialist", "Incomplete")
+
+    trail = workflow.get_audit_trail(first.request_id)
+
+    assert [entry["action"] for entry in trail] == ["CREATED", "REJECTED"]
+    assert [entry["action"] for entry in workflow.get_audit_trail(second.request_id)] == ["CREATED"]
+    assert workflow.get_audit_trail("unknown") == []
+    assert len(workflow.get_audit_trail()) == 3
@@ -0,0 +1,51 @@
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.logging_utils import export_feedback_to_excel, record_feedback_tag
+
+
+def test_feedback_tags_append_as_json_lines(tmp_path):
+    ledger = tmp_path / "feedback_tags.jsonl"
+
+    record_feedback_tag("scan_started", "Outlook scan", context={"rows": 3}, path=ledger)
+    record_feedback_tag("scan_failed", "Timeout", severity="error", path=ledger)
+
+    lines = [json.loads(line) for line in ledger.read_text(encoding="utf-8").splitlines()]
+    assert [entry["event"] for entry in lines] == ["scan_started", "scan_failed"]
+    assert lines[0]["context"] == {"rows": 3}
+    assert lines[1]["severity"] == "error"
+
+
+def test_feedback_write_failures_are_silent(tmp_path):
+    record_feedback_tag("noop", "missing dir", path=tmp_path / "missing" / "ledger.jsonl")
+
+
+def test_feedback_ledger_exports_to_excel(tmp_path):
+    import pandas as pd
+
+    ledger = tmp_path / "feedback_tags.jsonl"
+    record_feedback_tag("scan_started", "Outlook scan", context={"rows": 3}, path=ledger)
+
+    workbook = export_feedback_to_excel(ledger)
+
+    frame = pd.read_excel(workbook)
+    assert workbook.suffix == ".xlsx"
+    assert frame.loc[0, "event"] == "scan_started"
+    assert json.loads(frame.loc[0, "context"]) == {"rows": 3}
+
+
+def test_json_line_matches_without_orjson(monkeypatch):
+    from backend import logging_utils
+
+    payload = {"event": "scan", "context": {"rows": 3, "label": "Lêer"}}
+    fast = logging_utils._json_line(payload)
+    monkeypatch.setattr(logging_utils, "orjson", None)
+    plain = logging_utils._json_line(payload)
+
+    assert fast.endswith(b"\n") and plain.endswith(b"\n")
+    assert json.loads(fast) == json.loads(plain) == payload
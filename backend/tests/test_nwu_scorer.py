@@ -0,0 +1,42 @@
+import json
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.nwu_brain.scoring import NWUScorer
+
+
+BRAIN_FILES = {
+    "policy_registry.json": {},
+    "clause_packs.json": {},
+    "kpa_router.json": {
+        "by_extension": {"pdf": [1]},
+        "by_regex": [{"pattern": "moderation|assessment", "kpa": [4]}, {"pattern": "", "kpa": [5]}],
+    },
+    "tier_keywords.json": {"Transformational": ["award"]},
+    "values_index.json": {"values": [{"name": "Integrity", "patterns": ["ethic", "honest"]}]},
+    "institution_profile.json": {},
+}
+
+
+@pytest.fixture
+def scorer(tmp_path: Path) -> NWUScorer:
+    for name, payload in BRAIN_FILES.items():
+        (tmp_path / name).write_text(json.dumps(payload), encoding="utf-8")
+    manifest = tmp_path / "brain_manifest.json"
+    manifest.write_text(json.dumps({"files": {name: name for name in BRAIN_FILES}}), encoding="utf-8")
+    return NWUScorer(manifest)
+
+
+def test_router_and_values_use_compiled_tables(scorer):
+    out = scorer.compute({"title": "report.pdf", "full_text": "Moderation ethics, honest ethics"})
+
+    assert out["kpa"] == [1, 4]
+    assert out["values_hits"] == ["Integrity"]
+    assert out["values_score"] == round(5.0 * (1.0 - math.exp(-0.15 * 3)), 3)
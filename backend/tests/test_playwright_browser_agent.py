@@ -0,0 +1,183 @@
+import asyncio
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend import playwright_browser_agent
+
+
+class DelayedPage:
+    """Selectors resolve after a per-selector delay; unknown ones time out."""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.cancelled = []
+
+    async def wait_for_selector(self, selector, timeout=None):
+        delay = self.delays.get(selector)
+        try:
+            if delay is None:
+                await asyncio.sleep(timeout / 1000)
+                raise TimeoutError(selector)
+            await asyncio.sleep(delay)
+            return selector
+        except asyncio.CancelledError:
+            self.cancelled.append(selector)
+            raise
+
+
+def test_any_selector_races_all_selectors():
+    page = DelayedPage({"#late": 0.05, "#ready": 0.01})
+
+    found = asyncio.run(
+        playwright_browser_agent._page_has_any_selector(page, ["#missing", "#late", "#ready"], timeout=1000)
+    )
+
+    assert found is True
+    assert set(page.cancelled) == {"#missing", "#late"}
+
+
+def test_any_selector_ignores_failures_until_all_time_out():
+    page = DelayedPage({})
+
+    found = asyncio.run(playwright_browser_agent._page_has_any_selector(page, ["#a", "#b"], timeout=10))
+
+    assert found is False
+
+
+class FakeEmitter:
+    def __init__(self):
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def remove_listener(self, event, handler):
+        if self.handlers.get(event) is handler:
+            del self.handlers[event]
+
+
+class FakeContext(FakeEmitter):
+    def __init__(self, browser=None, fail_after=None):
+        super().__init__()
+        self.saved = []
+        self.browser = browser
+        self.fail_after = fail_after
+
+    async def storage_state(self, path=None):
+        if self.fail_after is not None and len(self.saved) >= self.fail_after:
+            raise RuntimeError("context closed")
+        self.saved.append(path)
+
+
+def test_storage_state_is_resaved_until_context_closes(tmp_path):
+    context = FakeContext()
+    state_file = tmp_path / "state.json"
+
+    async def scenario():
+        task = playwright_browser_agent._keep_storage_state_fresh(context, state_file, interval=0.01)
+        await asyncio.sleep(0.035)
+        context.handlers["close"]()
+        await asyncio.gather(task, return_exceptions=True)
+        saved = len(context.saved)
+        await asyncio.sleep(0.03)
+        return task, saved
+
+    task, saved = asyncio.run(scenario())
+
+    assert task.cancelled()
+    assert saved >= 2
+    assert len(context.saved) == saved
+    assert set(context.saved) == {str(state_file)}
+
+
+def test_storage_state_refresh_stops_when_the_browser_disconnects(tmp_path):
+    browser = FakeEmitter()
+    context = FakeContext(browser=browser)
+
+    async def scenario():
+        task = playwright_browser_agent._keep_storage_state_fresh(context, tmp_path / "s.json", interval=0.01)
+        await asyncio.sleep(0.015)
+        browser.handlers["disconnected"]()
+        await asyncio.gather(task, return_exceptions=True)
+        return task
+
+    task = asyncio.run(scenario())
+
+    assert task.cancelled()
+    assert "disconnected" not in browser.handlers
+
+
+def test_storage_state_refresh_stops_after_a_failed_save(tmp_path):
+    browser = FakeEmitter()
+    context = FakeContext(browser=browser, fail_after=1)
+
+    async def scenario():
+        task = playwright_browser_agent._keep_storage_state_fresh(context, tmp_path / "s.json", interval=0.01)
+        await asyncio.wait_for(task, timeout=1)
+        return task
+
+    task = asyncio.run(scenario())
+
+    assert task.done() and not task.cancelled()
+    assert len(context.saved) == 1
+    assert "disconnected" not in browser.handlers
+
+
+class LoginPage:
+    """Ready selector only shows up after the quick 3 s probe has given up."""
+
+    def __init__(self):
+        self.waits = []
+
+    async def goto(self, url, timeout=None):
+        return None
+
+    async def wait_for_selector(self, selector, timeout=None):
+        self.waits.append((selector, timeout))
+        if timeout <= 3000:
+            raise TimeoutError(selector)
+        return selector
+
+
+class LoginContext(FakeContext):
+    def __init__(self, page):
+        super().__init__()
+        self.page = page
+
+    async def new_page(self):
+        return self.page
+
+
+def test_login_wait_is_one_race_over_the_full_timeout(monkeypatch, tmp_path):
+    from backend import vamp_agent
+
+    page = LoginPage()
+    context = LoginContext(page)
+
+    class Browser:
+        async def new_context(self, **kwargs):
+            return context
+
+    async def noop(*args, **kwargs):
+        return None
+
+    monkeypatch.setattr(playwright_browser_agent, "ensure_browser", noop)
+    monkeypatch.setattr(playwright_browser_agent, "apply_stealth", noop)
+    monkeypatch.setattr(playwright_browser_agent, "_keep_storage_state_fresh", lambda *args: None)
+    monkeypatch.setattr(vamp_agent, "_BROWSER", Browser(), raising=False)
+    monkeypatch.setattr(vamp_agent, "_base_context_kwargs", lambda: {})
+    state_file = tmp_path / "state.json"
+
+    result = asyncio.run(
+        playwright_browser_agent.get_or_create_browser_context(
+            str(state_file), "https://example.org", ["#ready"], timeout=300
+        )
+    )
+
+    assert result is context
+    assert page.waits == [("#ready", 3000), ("#ready", 300000)]
+    assert context.saved == [str(state_file)]
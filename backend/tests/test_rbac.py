@@ -0,0 +1,172 @@
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.rbac import AccessContext, AccessControl, Permission, Role, RolePermissionMapper, User
+
+
+def _user(user_id: str, *roles: Role) -> User:
+    user = User(user_id, user_id, f"{user_id}@example.com")
+    for role in roles:
+        user.add_role(role)
+    return user
+
+
+def test_role_permissions_are_shared_read_only_sets():
+    perms = RolePermissionMapper.get_permissions_for_role(Role.VIEWER)
+
+    assert perms is RolePermissionMapper.get_permissions_for_role(Role.VIEWER)
+    assert isinstance(perms, frozenset)
+    assert Permission.READ_EVIDENCE in perms
+
+
+def test_user_permissions_union_roles_and_custom_grants():
+    user = _user("u1", Role.VIEWER, Role.COMPLIANCE_OFFICER)
+    user.custom_permissions.add(Permission.MANAGE_USERS)
+
+    perms = RolePermissionMapper.get_permissions_for_user(user)
+
+    assert Permission.AUDIT_EVIDENCE in perms
+    assert Permission.MANAGE_USERS in perms
+    assert Permission.APPROVE_EVIDENCE not in perms
+
+
+def test_check_permission_grants_and_denies():
+    ac = AccessControl()
+    user = _user("u1", Role.HR_SPECIALIST)
+
+    assert ac.check_permission(AccessContext(user, Permission.APPROVE_EVIDENCE))
+    assert not ac.check_permission(AccessContext(user, Permission.MANAGE_ROLES))
+    assert [entry["action"] for entry in ac.get_audit_trail("u1")] == ["GRANT", "DENY"]
+
+
+def test_permission_cache_follows_role_changes_and_is_shared():
+    ac = AccessControl()
+    first = _user("u1", Role.VIEWER)
+    second = _user("u2", Role.VIEWER)
+
+    assert not ac.check_permission(AccessContext(first, Permission.APPROVE_EVIDENCE))
+    first.add_role(Role.HR_SPECIALIST)
+    assert ac.check_permission(AccessContext(first, Permission.APPROVE_EVIDENCE))
+
+    ac.check_permission(AccessContext(second, Permission.READ_EVIDENCE))
+    assert len(ac.permission_cache) == 2
+
+
+def test_invalidate_user_cache_is_deprecated_and_revocation_still_applies():
+    ac = AccessControl()
+    user = _user("u1", Role.HR_SPECIALIST)
+    context = AccessContext(user, Permission.APPROVE_EVIDENCE)
+    assert ac.check_permission(context)
+
+    user.remove_role(Role.HR_SPECIALIST)
+    with pytest.warns(DeprecationWarning):
+        ac.invalidate_user_cache("u1")
+
+    assert not ac.check_permission(context)
+
+
+def test_permission_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(AccessControl, "PERMISSION_CACHE_SIZE", 2)
+    ac = AccessControl()
+
+    for user_id, role in (("a", Role.VIEWER), ("b", Role.HR_MANAGER), ("c", Role.COMPLIANCE_OFFICER)):
+        ac.check_permission(AccessContext(_user(user_id, role), Permission.READ_EVIDENCE))
+
+    assert list(ac.permission_cache) == [
+        (frozenset({Role.HR_MANAGER}), frozenset()),
+        (frozenset({Role.COMPLIANCE_OFFICER}), frozenset()),
+    ]
+
+
+def test_system_admin_short_circuits_without_caching():
+    ac = AccessControl()
+    admin = _user("root", Role.SYSTEM_ADMIN, Role.VIEWER)
+
+    assert RolePermissionMapper.get_permissions_for_user(admin) == frozenset(Permission)
+    assert ac.check_permission(AccessContext(admin, Permission.MANAGE_ROLES))
+    assert not ac.permission_cache
+
+    admin.is_active = False
+    assert not ac.check_permission(AccessContext(admin, Permission.MANAGE_ROLES))
+
+
+def test_audit_timestamps_are_formatted_on_read():
+    ac = AccessControl()
+    user = _user("u1", Role.VIEWER)
+    when = datetime(2024, 5, 2, 9, 30, 15, 123456)
+    context = AccessContext(user, Permission.READ_EVIDENCE, timestamp=when)
+
+    ac.check_permission(context)
+
+    assert ac.audit_log[0][0] is when
+    [entry] = ac.get_audit_trail()
+    assert entry["timestamp"] == "2024-05-02T09:30:15.123456"
+
+
+def test_audit_log_is_bounded_and_expands_on_read(monkeypatch):
+    monkeypatch.setattr(AccessControl, "AUDIT_LOG_SIZE", 2)
+    ac = AccessControl()
+    user = _user("u1", Role.VIEWER)
+
+    ac.check_permission(AccessContext(user, Permission.READ_EVIDENCE, resource_id="r0"))
+    ac.check_permission(AccessContext(user, Permission.VIEW_WORKFLOW, resource_id="r1"))
+    ac.check_permission(AccessContext(user, Permission.MANAGE_USERS, resource_id="r2"))
+
+    grant, deny = ac.get_audit_trail("u1")
+    assert len(ac.audit_log) == 2
+    assert grant["resource_id"] == "r1" and "reason" not in grant
+    assert deny == dict(deny, action="DENY", permission="manage_users", reason="Permission denied")
+
+
+def test_set_checks_write_one_audit_entry():
+    ac = AccessControl()
+    user = _user("u1", Role.HR_SPECIALIST)
+    required = {Permission.APPROVE_EVIDENCE, Permission.READ_EVIDENCE}
+    context = AccessContext(user, Permission.READ_EVIDENCE)
+
+    assert ac.check_permissions(context, required)
+    assert not ac.check_permissions(context, required | {Permission.MANAGE_USERS})
+    assert ac.check_any_permission(context, {Permission.MANAGE_USERS, Permission.APPROVE_EVIDENCE})
+    assert not ac.check_any_permission(context, {Permission.MANAGE_USERS})
+
+    trail = ac.get_audit_trail()
+    assert [entry["action"] for entry in trail] == ["GRANT", "DENY", "GRANT", "DENY"]
+    assert trail[0]["permission"] == "approve_evidence,read_evidence"
+    assert context.required_permission is Permission.READ_EVIDENCE
+
+
+def test_empty_permission_sets_keep_baseline_results_without_auditing():
+    ac = AccessControl()
+    user = _user("u1", Role.VIEWER)
+    user.is_active = False
+    context = AccessContext(user, Permission.READ_EVIDENCE)
+
+    assert ac.check_permissions(context, set())
+    assert not ac.check_any_permission(context, set())
+    assert not ac.audit_log
+
+
+def test_user_and_context_use_slots():
+    user = _user("u1", Role.VIEWER)
+
+    assert not hasattr(user, "__dict__")
+    assert not hasattr(AccessContext(user, Permission.READ_EVIDENCE), "__dict__")
+
+
+def test_permission_masks_match_permission_sets():
+    bits = [permission.bit for permission in Permission]
+    assert len(set(bits)) == len(bits)
+
+    for role in Role:
+        user = _user("u1", role)
+        user.custom_permissions.add(Permission.VIEW_AUDIT_LOG)
+        mask = RolePermissionMapper.get_mask_for_user(user)
+        perms = RolePermissionMapper.get_permissions_for_user(user)
+        assert {p for p in Permission if mask & p.bit} == set(perms), role
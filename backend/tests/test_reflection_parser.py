@@ -0,0 +1,182 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.reflection_parser import DecisionCategory, ReflectionForm, ReflectionParser
+
+
+def test_form_html_renders_sections_questions_and_escapes_text():
+    form = ReflectionForm(form_id="f1", title="Q&A <review>", description="Desc")
+    form.add_section("Section", "About", [{"text": "Rate it", "type": "rating"}, {"text": "Why?", "type": "textarea"}])
+    form.add_question("text", "Anything else?", required=False)
+
+    html = form.to_html()
+
+    assert html.startswith('<form id="f1" class="reflection-form">')
+    assert "<h2>Q&amp;A &lt;review&gt;</h2>" in html
+    assert '<input type="range" min="1" max="5" name="" />' in html
+    assert '<textarea name=""></textarea>' in html
+    assert "<label>Anything else?</label>" in html
+    assert html.endswith('    <button type="submit">Submit Feedback</button>\n</form>')
+
+
+def test_generated_form_matches_its_category():
+    parser = ReflectionParser()
+
+    form = parser.generate_feedback_form(DecisionCategory.ESCALATION_PATTERNS, "Escalations")
+
+    html = form.to_html()
+    assert "<legend>Escalation Analysis</legend>" in html
+    assert "Escalation was justified" in html
+    assert "Additional comments or concerns:" in html
+
+
+def test_form_template_is_compiled_once_and_shared():
+    from backend import reflection_parser
+
+    assert reflection_parser._ENV.get_template("reflection_form.html") is reflection_parser._FORM_TEMPLATE
+
+
+def test_batch_analysis_shares_one_timestamp():
+    parser = ReflectionParser()
+    decisions = [
+        {"id": "d1", "approval_time": 100, "confidence": 90},
+        {"id": "d2", "approval_time": 5000, "confidence": 90},
+        {"id": "d3", "escalated": True},
+    ]
+
+    results = parser.analyze_batch_decisions(decisions)
+
+    assert results["by_category"] == {"workflow_efficiency": 1, "decision_time": 1, "escalation_patterns": 1}
+    assert results["patterns_detected"] == ["High escalation rate - may indicate process complexity"]
+    history = parser.get_analysis_history()
+    assert [entry["action"] for entry in history] == ["ANALYZED"] * 3 + ["BATCH_ANALYSIS_COMPLETE"]
+    assert {entry["timestamp"] for entry in history} == {results["timestamp"]}
+
+
+def test_form_ids_are_unique():
+    parser = ReflectionParser()
+
+    ids = {parser.generate_feedback_form(DecisionCategory.DECISION_TIME, "t").form_id for _ in range(3)}
+
+    assert len(ids) == 3
+    assert all(form_id.startswith("form_decision_time_") for form_id in ids)
+
+
+def _sample_decisions(n):
+    return [
+        {"id": f"d{i}", "approval_time": (i * 397) % 7200, "confidence": 50 + (i * 7) % 50, "escalated": i % 11 == 0}
+        for i in range(n)
+    ]
+
+
+def test_vectorized_batch_matches_per_decision_loop(monkeypatch):
+    from backend import reflection_parser
+
+    decisions = _sample_decisions(300)
+    vectorized = ReflectionParser()
+    vec_results = vectorized.analyze_batch_decisions(decisions)
+
+    monkeypatch.setattr(reflection_parser, "VECTORIZE_THRESHOLD", 10_000)
+    looped = ReflectionParser()
+    loop_results = looped.analyze_batch_decisions(decisions)
+
+    assert list(vec_results["by_category"].items()) == list(loop_results["by_category"].items())
+    assert vec_results["insights_generated"] == loop_results["insights_generated"] == 300
+    strip = lambda insight: (insight.decision_id, insight.category, insight.description, insight.metrics)
+    assert [strip(i) for i in vectorized.insights] == [strip(i) for i in looped.insights]
+
+
+def test_vectorized_batch_defers_bad_records_to_the_loop():
+    decisions = _sample_decisions(300) + [{"id": "bad", "confidence": "high"}]
+    parser = ReflectionParser()
+
+    results = parser.analyze_batch_decisions(decisions)
+
+    assert results["insights_generated"] == 300
+
+
+def test_insights_are_stored_as_columns_and_filtered_by_category():
+    parser = ReflectionParser()
+    parser.analyze_batch_decisions(_sample_decisions(300))
+    single = parser.analyze_decision({"id": "one", "escalated": True})
+
+    escalations = parser.get_insights_by_category(DecisionCategory.ESCALATION_PATTERNS)
+
+    assert single.decision_id == "one"
+    assert escalations[-1] == single
+    assert [i.decision_id for i in escalations[:-1]] == [f"d{i}" for i in range(0, 300, 11)]
+    assert all(i.description.startswith("Decision required escalation") for i in escalations)
+    assert parser.get_insights_by_category(DecisionCategory.POLICY_ADHERENCE) == []
+    assert len(parser.insights) == 301
+
+
+def test_rejected_decisions_leave_no_stored_row():
+    parser = ReflectionParser()
+    bad = [{"id": "none", "escalated": True, "confidence": None}, {"id": "str", "confidence": "high"}]
+
+    assert parser.analyze_decision(bad[0]) is None
+    results = parser.analyze_batch_decisions(bad + [{"id": "ok", "escalated": True, "confidence": 80}])
+
+    assert results["insights_generated"] == 1
+    assert [i.decision_id for i in parser.insights] == ["ok"]
+    assert [i.decision_id for i in parser.get_insights_by_category(DecisionCategory.ESCALATION_PATTERNS)] == ["ok"]
+
+
+def test_generated_forms_use_the_specialized_template(monkeypatch):
+    from backend import reflection_parser
+
+    parser = ReflectionParser()
+    form = parser.generate_feedback_form(DecisionCategory.EVIDENCE_QUALITY, "Evidence")
+    specialized_html = form.to_html()
+
+    class Boom:
+        def render(self, **kwargs):
+            raise AssertionError("generic template used")
+
+    monkeypatch.setattr(reflection_parser, "_FORM_TEMPLATE", Boom())
+    assert form.to_html() == specialized_html
+    assert "<legend>Evidence Assessment</legend>" in specialized_html
+
+    form.add_section("Follow-up", "Anything else?", [{"text": "Notes", "type": "textarea"}])
+    monkeypatch.undo()
+    html = form.to_html()
+    assert "<legend>Evidence Assessment</legend>" in html and "<legend>Follow-up</legend>" in html
+
+
+def test_analysis_history_is_a_read_only_snapshot():
+    parser = ReflectionParser()
+    parser.analyze_decision({"id": "d1"})
+
+    history = parser.get_analysis_history()
+    parser.analyze_decision({"id": "d2"})
+
+    assert isinstance(history, tuple)
+    assert [entry["details"] for entry in history] == ["d1"]
+    assert len(parser.get_analysis_history()) == 2
+
+
+def test_analyze_decision_defaults_missing_fields():
+    parser = ReflectionParser()
+
+    full = parser.analyze_decision({"id": "a", "approval_time": 10, "confidence": 60, "escalated": False})
+    partial = parser.analyze_decision({"id": "b", "confidence": 60})
+
+    assert full.category == partial.category == DecisionCategory.APPROVER_CONFIDENCE
+    assert partial.metrics == {"approval_time_seconds": 0, "confidence_score": 60, "was_escalated": False}
+    assert parser.analyze_decision(["not", "a", "dict"]) is None
+
+
+def test_streamed_html_matches_to_html():
+    parser = ReflectionParser()
+    generated = parser.generate_feedback_form(DecisionCategory.WORKFLOW_EFFICIENCY, "Flow")
+    custom = ReflectionForm(form_id="c", title="Custom", description="d")
+    custom.add_section("S", "D", [{"text": "Why?", "type": "textarea"}])
+
+    for form in (generated, custom):
+        chunks = list(form.to_html_stream())
+        assert len(chunks) > 1
+        assert "".join(chunks) == form.to_html()
@@ -0,0 +1,293 @@
+import asyncio
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend import vamp_agent
+
+
+class FakePage:
+    """Minimal stand-in for a Playwright page that records selector queries."""
+
+    def __init__(self, matches, invalid=()):
+        self.matches = matches
+        self.invalid = set(invalid)
+        self.queries = []
+
+    async def query_selector_all(self, selector):
+        self.queries.append(selector)
+        parts = [part.strip() for part in selector.split(",")]
+        if any(part in self.invalid for part in parts):
+            raise ValueError(f"invalid selector: {selector}")
+        found = []
+        for part in parts:
+            for node in self.matches.get(part, []):
+                if node not in found:
+                    found.append(node)
+        return found
+
+
+def test_union_query_uses_one_round_trip():
+    page = FakePage({"a": ["row1", "row2"], "b": ["row2", "row3"]})
+
+    rows = asyncio.run(vamp_agent._query_all_with_union(page, "a, b", ("a", "b")))
+
+    assert rows == ["row1", "row2", "row3"]
+    assert page.queries == ["a, b"]
+
+
+def test_union_query_falls_back_per_selector_when_rejected():
+    page = FakePage({"a": ["row1"], "c": ["row3"]}, invalid={"b"})
+
+    rows = asyncio.run(vamp_agent._query_all_with_union(page, "a, b, c", ("a", "b", "c")))
+
+    assert rows == ["row1", "row3"]
+    assert page.queries == ["a, b, c", "a", "b", "c"]
+
+
+def test_union_fallback_can_stop_at_first_matching_selector():
+    page = FakePage({"a": [], "b": ["row1", "row2"], "c": ["row2"]}, invalid={"x"})
+
+    rows = asyncio.run(
+        vamp_agent._query_all_with_union(page, "x, a, b, c", ("x", "a", "b", "c"), first_hit=True)
+    )
+
+    assert rows == ["row1", "row2"]
+    assert page.queries == ["x, a, b, c", "x", "a", "b"]
+
+
+class FakeElement:
+    def __init__(self, text):
+        self.text = text
+
+    async def inner_text(self):
+        return self.text
+
+
+class FakeRow:
+    def __init__(self, fields, attrs, installed_meta=None):
+        self.fields = fields
+        self.attrs = attrs
+        self.installed_meta = installed_meta
+
+    async def query_selector(self, selector):
+        text = self.fields.get(selector)
+        return FakeElement(text) if text is not None else None
+
+    async def evaluate(self, script, arg=None):
+        if self.installed_meta is not None and arg is not None:
+            return dict(self.installed_meta)
+        return dict(self.attrs)
+
+
+class FakeMetaPage:
+    def __init__(self, result=None, error=None, install_error=None):
+        self.result = result
+        self.error = error
+        self.install_error = install_error
+        self.installs = 0
+        self.calls = 0
+
+    async def evaluate(self, script, arg=None):
+        if arg is None:
+            self.installs += 1
+            if self.install_error:
+                raise self.install_error
+            return None
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return self.result(arg["rows"])
+
+
+def test_row_metas_are_read_in_one_evaluate():
+    rows = [object(), object()]
+    page = FakeMetaPage(result=lambda handles: [{"subject": f"s{i}"} for i, _ in enumerate(handles)])
+
+    metas = asyncio.run(vamp_agent._extract_row_metas(page, rows))
+
+    assert metas == [{"subject": "s0"}, {"subject": "s1"}]
+    assert page.installs == 1
+    assert page.calls == 1
+
+
+def test_row_metas_fall_back_to_installed_extractor_per_row():
+    row = FakeRow({}, {}, installed_meta={"subject": "From page script"})
+    page = FakeMetaPage(error=RuntimeError("stale handle"))
+
+    [meta] = asyncio.run(vamp_agent._extract_row_metas(page, [row]))
+
+    assert meta == {"subject": "From page script"}
+
+
+def test_row_metas_fall_back_to_per_row_reads():
+    subject_sel = vamp_agent.OUTLOOK_SELECTORS.message_subject[1]
+    row = FakeRow({subject_sel: "  Budget   review "}, {"aria": "Budget", "convoId": "c1"})
+    page = FakeMetaPage(install_error=RuntimeError("navigated away"))
+
+    [meta] = asyncio.run(vamp_agent._extract_row_metas(page, [row]))
+
+    assert meta["subject"] == "Budget review"
+    assert meta["sender"] == ""
+    assert meta["convoId"] == "c1"
+
+
+class FakeInput:
+    async def wheel(self, *args):
+        return None
+
+    async def press(self, *args):
+        return None
+
+
+class FakeOutlookPage:
+    def __init__(self, rows, metas):
+        self.rows = rows
+        self.metas = metas
+        self.mouse = FakeInput()
+        self.keyboard = FakeInput()
+        self.row_queries = 0
+
+    async def wait_for_load_state(self, *args, **kwargs):
+        return None
+
+    async def wait_for_selector(self, *args, **kwargs):
+        return None
+
+    async def wait_for_timeout(self, *args):
+        return None
+
+    async def query_selector_all(self, selector):
+        self.row_queries += 1
+        return list(self.rows)
+
+    async def evaluate(self, script, arg=None):
+        return [dict(meta) for meta in self.metas]
+
+
+class ClickTrackingRow:
+    def __init__(self):
+        self.clicked = False
+
+    async def click(self, *args, **kwargs):
+        self.clicked = True
+
+    async def scroll_into_view_if_needed(self):
+        return None
+
+
+def test_scrape_outlook_metadata_only_never_opens_messages():
+    rows = [ClickTrackingRow(), ClickTrackingRow()]
+    metas = [
+        {"subject": "Moderation report", "sender": "Dean", "date": "2025-05-02", "convoId": "c1", "inView": True},
+        {"subject": "Exam board", "sender": "HoD", "preview": "Agenda", "date": "2025-05-03", "convoId": "c2"},
+    ]
+    page = FakeOutlookPage(rows, metas)
+
+    items = asyncio.run(vamp_agent.scrape_outlook(page, include_body=False))
+
+    assert [item["title"] for item in items] == ["Moderation report", "Exam board"]
+    assert items[1]["preview"] == "Agenda"
+    assert not any(row.clicked for row in rows)
+    assert all("body" not in item and "attachments_present" not in item for item in items)
+    assert page.row_queries == 0
+
+
+def test_scrape_onedrive_keeps_one_item_per_file_for_nested_rows():
+    name_sel = vamp_agent.ONEDRIVE_SELECTORS.name[0]
+    modified_sel = vamp_agent.ONEDRIVE_SELECTORS.modified[0]
+    outer = FakeRow({name_sel: "Report.docx", modified_sel: "2025-05-02"}, {})
+    nested = FakeRow({name_sel: "Report.docx", modified_sel: "2025-05-02"}, {})
+    other = FakeRow({name_sel: "Plan.xlsx", modified_sel: "2025-05-03"}, {})
+    page = FakeOutlookPage([outer, nested, other], [])
+
+    items = asyncio.run(vamp_agent.scrape_onedrive(page))
+
+    assert [item["path"] for item in items] == ["Report.docx", "Plan.xlsx"]
+
+
+def test_scan_ws_passes_include_body_through(monkeypatch):
+    calls = []
+
+    async def fake_run_scan_active(**kwargs):
+        calls.append(kwargs)
+        return []
+
+    monkeypatch.setattr(vamp_agent, "run_scan_active", fake_run_scan_active)
+
+    asyncio.run(vamp_agent.run_scan_active_ws(url="https://outlook.office.com/mail/", include_body="false"))
+    asyncio.run(vamp_agent.run_scan_active_ws(url="https://outlook.office.com/mail/"))
+
+    assert [call["include_body"] for call in calls] == [False, True]
+
+
+def test_selector_configs_precompute_unions():
+    onedrive = vamp_agent.ONEDRIVE_SELECTORS
+    outlook = vamp_agent.OUTLOOK_SELECTORS
+
+    assert onedrive.row_union == ", ".join(onedrive.row)
+    assert onedrive.grid_union == ", ".join(onedrive.grid)
+    assert outlook.inbox_list_union == ", ".join(outlook.inbox_list)
+    assert vamp_agent.OUTLOOK_ROW_UNION == ", ".join(outlook.message_row)
+
+
+class WaitingNode:
+    def __init__(self, element):
+        self.element = element
+        self.lookups = 0
+
+    async def wait_for_selector(self, selector, timeout=None):
+        return self.element
+
+    async def query_selector(self, selector):
+        self.lookups += 1
+        return self.element
+
+
+def test_extract_element_text_uses_the_waited_element():
+    node = WaitingNode(FakeElement("  Module   guide  "))
+
+    text = asyncio.run(vamp_agent._extract_element_text(node, "h1", allow_ocr=False))
+
+    assert text == "Module guide"
+    assert node.lookups == 0
+
+
+def test_service_for_host_keeps_first_match_precedence():
+    assert vamp_agent._service_for_host("outlook.office365.com") == "outlook"
+    assert vamp_agent._service_for_host("nwu-my.sharepoint.com") == "onedrive"
+    assert vamp_agent._service_for_host("drive.google.com") == "drive"
+    assert vamp_agent._service_for_host("efundi.nwu.ac.za") == "efundi"
+    assert vamp_agent._service_for_host("example.org") is None
+
+
+def test_retry_delay_backs_off_with_jitter_and_cap(monkeypatch):
+    monkeypatch.setattr(vamp_agent, "OUTLOOK_RETRY_WAIT_MS", 1000)
+    monkeypatch.setattr(vamp_agent.random, "random", lambda: 1.0)
+
+    assert vamp_agent._retry_delay_ms(0) == 750
+    assert vamp_agent._retry_delay_ms(1) == 1500
+    assert vamp_agent._retry_delay_ms(5) == vamp_agent.OUTLOOK_RETRY_MAX_WAIT_MS
+
+    monkeypatch.setattr(vamp_agent.random, "random", lambda: 0.0)
+    assert vamp_agent._retry_delay_ms(0) == 500
+
+
+def test_scrape_outlook_skips_duplicate_rows_before_opening(monkeypatch):
+    async def no_body(*args, **kwargs):
+        return ""
+
+    monkeypatch.setattr(vamp_agent, "_extract_element_text", no_body)
+    page = FakeOutlookPage([], [])
+    page.query_selector = no_body
+    rows = [ClickTrackingRow(), ClickTrackingRow()]
+    meta = {"subject": "Moderation report", "sender": "Dean", "date": "2025-05-02", "convoId": "c1"}
+    page.rows, page.metas = rows, [meta, meta]
+
+    items = asyncio.run(vamp_agent.scrape_outlook(page, deep_read=False))
+
+    assert len(items) == 1
+    assert [row.clicked for row in rows] == [True, False]
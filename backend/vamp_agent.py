@@ -16,13 +16,14 @@ import json
 import logging
 import os
 import platform
+import random
 import re
 import tempfile
 import time
 import shutil
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 from textwrap import dedent
 
@@ -70,9 +71,11 @@ from .date_utils import MonthBounds, compute_month_bounds, parse_outlook_date
 from .onedrive_selectors import ONEDRIVE_SELECTORS
 from .outlook_selectors import (
     ATTACHMENT_CANDIDATES,
+    ATTACHMENT_NAME_FALLBACK_SELECTORS,
     ATTACHMENT_NAME_SELECTORS,
     BODY_SELECTORS,
     OUTLOOK_ROW_SELECTORS,
+    OUTLOOK_ROW_UNION,
     OUTLOOK_SELECTORS,
 )
 from .vamp_store import _uid
@@ -130,6 +133,7 @@ BROWSER_CONFIG = {
 
 OUTLOOK_MAX_ROWS = int(os.getenv("VAMP_OUTLOOK_MAX_ROWS", "500"))
 OUTLOOK_RETRY_WAIT_MS = int(os.getenv("VAMP_OUTLOOK_RETRY_WAIT_MS", "1500"))
+OUTLOOK_RETRY_MAX_WAIT_MS = int(os.getenv("VAMP_OUTLOOK_RETRY_MAX_WAIT_MS", "5000"))
 
 # Mapping of env variable fallbacks for services
 SERVICE_ENV_VARS = {
@@ -939,10 +943,14 @@ def _expand_attachment_items(items: List[Dict[str, Any]]) -> List[Dict[str, Any]
         expanded.extend(_build_attachment_items(item))
     return expanded
 
+_WS_RE = re.compile(r"\s+")
+_CLOCK_RE = re.compile(r"(\d{1,2}:\d{2}\s*(?:am|pm)?)", re.IGNORECASE)
+
+
 def _clean_text(value: Optional[str]) -> str:
     if not value:
         return ""
-    return re.sub(r"\s+", " ", str(value)).strip()
+    return _WS_RE.sub(" ", str(value)).strip()
 
 
 async def _soft_scroll(page: Any, times: int = 5, delay: int = 500) -> None:
@@ -962,7 +970,7 @@ async def _soft_scroll(page: Any, times: int = 5, delay: int = 500) -> None:
         await page.wait_for_timeout(delay)
 
 
-async def _query_with_fallbacks(node: Any, selectors: List[str], attribute: Optional[str] = None) -> str:
+async def _query_with_fallbacks(node: Any, selectors: Sequence[str], attribute: Optional[str] = None) -> str:
     for sel in selectors:
         try:
             handle = await node.query_selector(sel)
@@ -982,6 +990,42 @@ async def _query_with_fallbacks(node: Any, selectors: List[str], attribute: Opti
             return text
     return ""
 
+def _retry_delay_ms(attempt: int) -> float:
+    """Exponential backoff with jitter around ``OUTLOOK_RETRY_WAIT_MS``.
+
+    The first retry waits about half the base delay, each later one doubles,
+    capped at ``OUTLOOK_RETRY_MAX_WAIT_MS``.
+    """
+    delay = (OUTLOOK_RETRY_WAIT_MS / 2) * (2 ** attempt) * (1 + random.random() * 0.5)
+    return min(delay, OUTLOOK_RETRY_MAX_WAIT_MS)
+
+
+async def _query_all_with_union(
+    node: Any, union: str, selectors: Sequence[str], *, first_hit: bool = False
+) -> List[Any]:
+    """Return nodes matching any of ``selectors`` in a single round-trip.
+
+    The browser dedupes the union and keeps document order. A single invalid
+    selector makes the whole union fail, so fall back to one query per
+    selector in that case. With ``first_hit`` the fallback stops at the first
+    selector that matches, since overlapping selectors would repeat nodes.
+    """
+    try:
+        return await node.query_selector_all(union)
+    except Exception:
+        pass
+
+    nodes: List[Any] = []
+    for sel in selectors:
+        try:
+            found = await node.query_selector_all(sel)
+        except Exception:
+            continue
+        if first_hit and found:
+            return found
+        nodes.extend(found)
+    return nodes
+
 def _now_iso() -> str:
     return dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds")
 
@@ -1042,7 +1086,7 @@ def _parse_ts(ts_str: str) -> Optional[dt.datetime]:
     if base_date is None:
         return None
 
-    time_match = re.search(r"(\d{1,2}:\d{2}\s*(?:am|pm)?)", value, flags=re.IGNORECASE)
+    time_match = _CLOCK_RE.search(value)
     time_value = dt.time(hour=0, minute=0, tzinfo=now.tzinfo)
     if time_match:
         token = time_match.group(1).strip()
@@ -1106,10 +1150,9 @@ async def _ocr_element_text(element: Any) -> str:
 
 async def _extract_element_text(node: Any, selector: str, timeout: int = 5000, allow_ocr: bool = True) -> str:
     """Extract text from first matching element with optional OCR fallback."""
-    element = None
     try:
-        await node.wait_for_selector(selector, timeout=timeout)
-        element = await node.query_selector(selector)
+        # wait_for_selector already resolves to the element; no second lookup needed
+        element = await node.wait_for_selector(selector, timeout=timeout)
     except Exception:
         element = None
 
@@ -1182,6 +1225,8 @@ async def _gather_outlook_attachments(page: Any, download_dir: Optional[Path] =
                 seen_nodes.add(handle_id)
 
             name = await _query_with_fallbacks(node, ATTACHMENT_NAME_SELECTORS)
+            if not name:
+                name = await _query_with_fallbacks(node, ATTACHMENT_NAME_FALLBACK_SELECTORS)
             if not name:
                 try:
                     aria = await node.get_attribute("aria-label")
@@ -1219,18 +1264,212 @@ async def _gather_outlook_attachments(page: Any, download_dir: Optional[Path] =
     return attachments
 
 
+# Row extractor installed once per page as window.__vampRowMeta so that the
+# batched call and the per-row fallback only ship a one-line caller.
+# Mirrors _query_with_fallbacks for each field.
+_ROW_META_FN = """
+(node, fields) => {
+    const squash = (value) => (value || "").replace(/\\s+/g, " ").trim();
+    const firstText = ({ union, selectors }) => {
+        // One walk settles the common "field absent" case; priority only matters on a hit
+        try {
+            if (!node.querySelector(union)) return "";
+        } catch (err) { /* invalid union: try selectors one by one */ }
+        for (const sel of selectors) {
+            let el = null;
+            try { el = node.querySelector(sel); } catch (err) { el = null; }
+            if (!el) continue;
+            const text = squash(el.innerText);
+            if (text) return text;
+        }
+        return "";
+    };
+    const attr = (name) => node.getAttribute(name) || "";
+    return {
+        subject: firstText(fields.subject),
+        sender: firstText(fields.sender),
+        preview: firstText(fields.preview),
+        date: firstText(fields.date),
+        aria: attr('aria-label'),
+        convoId: attr('data-convid') || attr('data-conversation-id') || attr('data-conversationid') || attr('data-unique-id'),
+        nodeText: node.innerText || "",
+        timestampAttr: attr('data-converteddatetime') || attr('data-timestamp'),
+        inView: (() => {
+            const r = node.getBoundingClientRect();
+            return r.height > 0 && r.top >= 0 && r.bottom <= window.innerHeight;
+        })()
+    };
+}
+"""
+
+_INSTALL_ROW_META_JS = "() => { window.__vampRowMeta = " + _ROW_META_FN.strip() + "; }"
+_ROW_META_JS = "({ rows, fields }) => rows.map((node) => window.__vampRowMeta(node, fields))"
+_ROW_META_CALL_JS = "(node, fields) => window.__vampRowMeta(node, fields)"
+# Finds the rows in the page itself so metadata comes back by value, no handles
+_LIST_ROW_METAS_JS = """
+({ union, selectors, fields }) => {
+    let nodes = [];
+    try {
+        nodes = Array.from(document.querySelectorAll(union));
+    } catch (err) {
+        for (const sel of selectors) {
+            try { nodes = Array.from(document.querySelectorAll(sel)); } catch (e) { continue; }
+            if (nodes.length) break;
+        }
+    }
+    return nodes.map((node) => window.__vampRowMeta(node, fields));
+}
+"""
+
+_ROW_META_FIELDS = {
+    name: {"union": ", ".join(selectors), "selectors": selectors}
+    for name, selectors in (
+        ("subject", OUTLOOK_SELECTORS.message_subject),
+        ("sender", OUTLOOK_SELECTORS.message_sender),
+        ("preview", OUTLOOK_SELECTORS.message_preview),
+        ("date", OUTLOOK_SELECTORS.message_date),
+    )
+}
+
+
+async def _extract_row_meta(row: Any) -> Dict[str, Any]:
+    """Read one Outlook row's metadata with per-selector round-trips."""
+    meta: Dict[str, Any] = {
+        "subject": await _query_with_fallbacks(row, OUTLOOK_SELECTORS.message_subject),
+        "sender": await _query_with_fallbacks(row, OUTLOOK_SELECTORS.message_sender),
+        "preview": await _query_with_fallbacks(row, OUTLOOK_SELECTORS.message_preview),
+        "date": await _query_with_fallbacks(row, OUTLOOK_SELECTORS.message_date),
+    }
+    try:
+        meta.update(
+            await row.evaluate(
+                """
+                (node) => {
+                    const attr = (name) => node.getAttribute(name) || "";
+                    return {
+                        aria: attr('aria-label'),
+                        convoId: attr('data-convid') || attr('data-conversation-id') || attr('data-conversationid') || attr('data-unique-id'),
+                        nodeText: node.innerText || "",
+                        timestampAttr: attr('data-converteddatetime') || attr('data-timestamp')
+                    };
+                }
+                """
+            )
+        )
+    except Exception as exc:
+        logger.debug("Outlook row metadata evaluation failed: %s", exc)
+    return meta
+
+
+async def _read_row_metas_by_value(page: Any) -> List[Dict[str, Any]]:
+    """Read metadata for every Outlook row without creating element handles.
+
+    Used when no message will be opened; returns ``[]`` if the page script
+    fails so the caller can fall back to the handle-based path.
+    """
+    try:
+        await page.evaluate(_INSTALL_ROW_META_JS)
+        metas = await page.evaluate(
+            _LIST_ROW_METAS_JS,
+            {"union": OUTLOOK_ROW_UNION, "selectors": list(OUTLOOK_ROW_SELECTORS), "fields": _ROW_META_FIELDS},
+        )
+    except Exception as exc:
+        logger.debug("Reading Outlook rows by value failed; using element handles: %s", exc)
+        return []
+    return metas if isinstance(metas, list) else []
+
+
+async def _extract_row_metas(page: Any, rows: List[Any]) -> List[Dict[str, Any]]:
+    """Read metadata for all Outlook rows in a single ``evaluate`` call.
+
+    The extractor is installed on the page first. If the batched call fails
+    (for example when a handle went stale mid-scroll), each row is read with
+    the installed extractor, and rows that still fail fall back to
+    :func:`_extract_row_meta`.
+    """
+    try:
+        await page.evaluate(_INSTALL_ROW_META_JS)
+    except Exception as exc:
+        logger.debug("Could not install Outlook row extractor; reading rows one by one: %s", exc)
+        return [await _extract_row_meta(row) for row in rows]
+
+    try:
+        metas = await page.evaluate(_ROW_META_JS, {"rows": rows, "fields": _ROW_META_FIELDS})
+        if isinstance(metas, list) and len(metas) == len(rows):
+            return metas
+    except Exception as exc:
+        logger.debug("Batched Outlook row metadata failed; reading rows one by one: %s", exc)
+
+    out: List[Dict[str, Any]] = []
+    for row in rows:
+        try:
+            out.append(await row.evaluate(_ROW_META_CALL_JS, _ROW_META_FIELDS))
+        except Exception:
+            out.append(await _extract_row_meta(row))
+    return out
+
+
+# Resolves with the first body selector whose node has rendered text, or null
+# after ``timeoutMs``. A MutationObserver re-checks only when the DOM changes,
+# instead of wait_for_function polling the page on every frame.
+_BODY_READY_JS = dedent(
+    f"""
+    (timeoutMs) => new Promise((resolve) => {{
+        const selectors = {json.dumps(BODY_SELECTORS)};
+        const find = () => {{
+            for (const sel of selectors) {{
+                const doc = document.querySelector(sel);
+                if (doc && doc.innerText && doc.innerText.trim().length > 0) {{
+                    return sel;
+                }}
+            }}
+            return null;
+        }};
+        const hit = find();
+        if (hit) {{
+            resolve(hit);
+            return;
+        }}
+        let timer = null;
+        const observer = new MutationObserver(() => {{
+            const sel = find();
+            if (sel) {{
+                observer.disconnect();
+                clearTimeout(timer);
+                resolve(sel);
+            }}
+        }});
+        observer.observe(document.body || document.documentElement, {{
+            subtree: true, childList: true, characterData: true
+        }});
+        timer = setTimeout(() => {{
+            observer.disconnect();
+            resolve(null);
+        }}, timeoutMs);
+    }})
+    """
+)
+
+
 async def scrape_outlook(
     page: Any,
     month_bounds: Optional[object] = None,
     *,
     deep_read: bool = True,
+    include_body: bool = True,
     on_progress: Optional[Callable[[int, str], Any]] = None,
 ) -> List[Dict[str, Any]]:
-    """Outlook scraper with optional deep read and month filtering."""
+    """Outlook scraper with optional deep read and month filtering.
+
+    With ``include_body=False`` only the list metadata (subject, sender,
+    preview, date) is returned and no message is opened; deep read needs an
+    open message, so it is skipped as well.
+    """
     items: List[Dict[str, Any]] = []
     seen_hashes: set[str] = set()
     download_dir: Optional[Path] = None
     now_ref = dt.datetime.now(dt.timezone.utc)
+    deep_read = deep_read and include_body
 
     if deep_read:
         try:
@@ -1240,12 +1479,10 @@ async def scrape_outlook(
 
     try:
         await page.wait_for_load_state("networkidle")
-        for inbox_selector in OUTLOOK_SELECTORS.inbox_list:
-            try:
-                await page.wait_for_selector(inbox_selector, timeout=12000)
-                break
-            except Exception:
-                continue
+        try:
+            await page.wait_for_selector(OUTLOOK_SELECTORS.inbox_list_union, timeout=12000)
+        except Exception:
+            pass
         await page.wait_for_selector('[role="listitem"], [role="option"]', timeout=20000)
     except Exception:
         logger.warning(
@@ -1260,22 +1497,22 @@ async def scrape_outlook(
     await _soft_scroll(page, times=20, delay=300)
 
     rows: List[Any] = []
-    selector_hits: List[Tuple[str, int]] = []
+    metas: List[Dict[str, Any]] = []
+    matched_union = False
 
     for attempt in range(3):
-        rows.clear()
-        selector_hits.clear()
-        for sel in OUTLOOK_ROW_SELECTORS:
-            try:
-                nodes = await page.query_selector_all(sel)
-            except Exception:
-                nodes = []
-            if not nodes:
-                continue
-            selector_hits.append((sel, len(nodes)))
-            rows.extend(nodes)
+        if not include_body:
+            # Nothing will be clicked, so skip element handles altogether
+            metas = await _read_row_metas_by_value(page)
+            if metas:
+                rows = [None] * len(metas)
+                matched_union = True
+                break
+
+        rows = await _query_all_with_union(page, OUTLOOK_ROW_UNION, OUTLOOK_ROW_SELECTORS, first_hit=True)
 
         if rows:
+            matched_union = True
             break
 
         if attempt < 2:
@@ -1284,7 +1521,7 @@ async def scrape_outlook(
                 attempt + 1,
             )
             await _soft_scroll(page, times=15 + (attempt * 5), delay=350)
-            await page.wait_for_timeout(OUTLOOK_RETRY_WAIT_MS)
+            await page.wait_for_timeout(_retry_delay_ms(attempt))
 
     if not rows:
         try:
@@ -1296,65 +1533,53 @@ async def scrape_outlook(
         logger.warning("No Outlook rows located after selector retries; returning empty result set")
         return items
 
-    if selector_hits:
-        for sel, count in selector_hits:
-            logger.debug("Outlook selector %s matched %d nodes", sel, count)
+    if matched_union:
+        logger.debug("Outlook row selectors matched %d nodes", len(rows))
     else:
         logger.debug("Outlook fallback selector matched %d nodes", len(rows))
 
     total_rows = len(rows) or 1
+    if not metas:
+        metas = await _extract_row_metas(page, rows)
+
+    # Rows that were on screen when metadata was read need no scroll until the
+    # list first moves; after that the viewport flags are stale.
+    list_scrolled = False
 
     for idx, row in enumerate(rows):
         if len(items) >= OUTLOOK_MAX_ROWS:
             break
 
-        try:
-            await row.scroll_into_view_if_needed()
-        except Exception:
+        meta = metas[idx] or {}
+
+        if row is not None and (list_scrolled or not meta.get("inView")):
+            list_scrolled = True
             try:
-                await row.evaluate("node => node.scrollIntoView({block: 'center', inline: 'nearest'})")
+                await row.scroll_into_view_if_needed()
             except Exception:
-                pass
-
-        meta: Dict[str, Any] = {}
-        subject = await _query_with_fallbacks(row, OUTLOOK_SELECTORS.message_subject)
-        sender = await _query_with_fallbacks(row, OUTLOOK_SELECTORS.message_sender)
-        preview = await _query_with_fallbacks(row, OUTLOOK_SELECTORS.message_preview)
-        ts_text = await _query_with_fallbacks(row, OUTLOOK_SELECTORS.message_date)
-        aria_label = ""
-        convo_id = ""
-        node_text = ""
+                try:
+                    await row.evaluate("node => node.scrollIntoView({block: 'center', inline: 'nearest'})")
+                except Exception:
+                    pass
 
-        try:
-            meta = await row.evaluate(
-                """
-                (node) => {
-                    const attr = (name) => node.getAttribute(name) || "";
-                    return {
-                        aria: attr('aria-label'),
-                        convoId: attr('data-convid') || attr('data-conversation-id') || attr('data-conversationid') || attr('data-unique-id'),
-                        nodeText: node.innerText || "",
-                        timestampAttr: attr('data-converteddatetime') || attr('data-timestamp')
-                    };
-                }
-                """
-            )
-        except Exception as exc:
-            logger.debug("Outlook row metadata evaluation failed: %s", exc)
+        subject = _clean_text(meta.get("subject"))
+        sender = _clean_text(meta.get("sender"))
+        preview = _clean_text(meta.get("preview"))
+        ts_text = _clean_text(meta.get("date"))
 
         aria_label = _clean_text(meta.get("aria")) if meta else ""
         convo_id = _clean_text(meta.get("convoId")) if meta else ""
         node_text = _clean_text(meta.get("nodeText")) if meta else ""
         if not ts_text and meta:
             ts_text = _clean_text(meta.get("timestampAttr"))
-        if not node_text:
+        if not node_text and row is not None:
             try:
                 direct_text = await row.inner_text()
             except Exception:
                 direct_text = ""
             node_text = _clean_text(direct_text)
-        if not node_text:
-            node_text = await _ocr_element_text(row)
+            if not node_text:
+                node_text = await _ocr_element_text(row)
 
         if node_text:
             parts = [p.strip() for p in node_text.split("\n") if p.strip()]
@@ -1398,53 +1623,51 @@ async def scrape_outlook(
         if ts is None and ts_text:
             logger.debug("Unable to parse Outlook timestamp '%s'; including email", ts_text)
 
-        try:
-            await row.hover()
-        except Exception:
-            pass
+        timestamp_value = ts.isoformat() if ts else now_ref.isoformat()
+        path_id = convo_id or f"{sender} - {subject}"
+
+        # The dedup key only needs list metadata, so repeats are skipped before
+        # paying for the click, body wait and attachment reads.
+        item_hash = _hash_from("outlook", path_id, timestamp_value)
+        if item_hash in seen_hashes:
+            continue
+        seen_hashes.add(item_hash)
 
         opened = False
-        try:
-            await row.click(timeout=4000)
-            opened = True
-        except Exception:
+        if include_body:
+            try:
+                await row.hover()
+            except Exception:
+                pass
+
             try:
-                await row.focus()
-                await page.keyboard.press("Enter")
+                await row.click(timeout=4000)
                 opened = True
             except Exception:
-                logger.debug("Unable to activate Outlook row for %s", subject)
+                try:
+                    await row.focus()
+                    await page.keyboard.press("Enter")
+                    opened = True
+                except Exception:
+                    logger.debug("Unable to activate Outlook row for %s", subject)
 
         body_text = ""
         if opened:
             try:
-                selectors_js = json.dumps(BODY_SELECTORS)
-                await page.wait_for_function(
-                    dedent(
-                        f"""
-                        () => {{
-                            const selectors = {selectors_js};
-                            for (const sel of selectors) {{
-                                const doc = document.querySelector(sel);
-                                if (doc && doc.innerText && doc.innerText.trim().length > 0) {{
-                                    return true;
-                                }}
-                            }}
-                            return false;
-                        }}
-                        """
-                    ),
-                    timeout=6000,
-                )
+                ready_selector = await page.evaluate(_BODY_READY_JS, 6000)
             except Exception:
-                await page.wait_for_timeout(500)
+                ready_selector = None
+
+            if isinstance(ready_selector, str):
+                # The pane already rendered text; read it without a second wait
+                body_text = await _extract_element_text(page, ready_selector, timeout=1000, allow_ocr=True)
 
             for selector in BODY_SELECTORS:
-                body_text = await _extract_element_text(
-                    page, selector, timeout=5000, allow_ocr=True
-                )
                 if body_text:
                     break
+                body_text = await _extract_element_text(
+                    page, selector, timeout=1500, allow_ocr=True
+                )
 
         if deep_read:
             try:
@@ -1459,8 +1682,6 @@ async def scrape_outlook(
 
         body_text = _clean_text(body_text)
 
-        timestamp_value = ts.isoformat() if ts else now_ref.isoformat()
-
         confidence = 0.95
         relative_label = None
         lowered_ts_text = ts_text.lower() if ts_text else ""
@@ -1474,7 +1695,6 @@ async def scrape_outlook(
         if ts is None:
             confidence = min(confidence, 0.45)
 
-        path_id = convo_id or f"{sender} - {subject}"
         item = {
             "source": "outlook",
             "path": path_id,
@@ -1524,10 +1744,6 @@ async def scrape_outlook(
             except Exception:
                 pass
 
-        item_hash = _hash_from(item["source"], item["path"], item.get("timestamp", ""))
-        if item_hash in seen_hashes:
-            continue
-        seen_hashes.add(item_hash)
         item["hash"] = item_hash
 
         items.append(item)
@@ -1544,23 +1760,18 @@ async def scrape_onedrive(page: Any, month_bounds: Optional[object] = None) -> L
     """OneDrive scraper with deep read and month filtering."""
     items: List[Dict[str, Any]] = []
 
-    for grid_selector in ONEDRIVE_SELECTORS.grid:
-        try:
-            await page.wait_for_selector(grid_selector, timeout=12000)
-            break
-        except Exception:
-            continue
+    try:
+        await page.wait_for_selector(ONEDRIVE_SELECTORS.grid_union, timeout=12000)
+    except Exception:
+        pass
 
     await _soft_scroll(page, times=15)
 
-    rows: List[Any] = []
-    for row_selector in ONEDRIVE_SELECTORS.row:
-        try:
-            rows = await page.query_selector_all(row_selector)
-        except Exception:
-            rows = []
-        if rows:
-            break
+    rows = await _query_all_with_union(
+        page, ONEDRIVE_SELECTORS.row_union, ONEDRIVE_SELECTORS.row, first_hit=True
+    )
+    # The union also matches nested row containers; keep one item per file
+    seen_hashes: set[str] = set()
 
     for row in rows:
         try:
@@ -1581,6 +1792,9 @@ async def scrape_onedrive(page: Any, month_bounds: Optional[object] = None) -> L
                 "timestamp": ts.isoformat() if ts else _now_iso(),
             }
             item["hash"] = _hash_from(item["source"], item["path"], item.get("timestamp", ""))
+            if item["hash"] in seen_hashes:
+                continue
+            seen_hashes.add(item["hash"])
             items.append(item)
             if len(items) >= 300:
                 break
@@ -1668,6 +1882,30 @@ async def scrape_efundi(page: Any, month_bounds: Optional[object] = None) -> Lis
 # Router and Main Scan Function
 # --------------------------------------------------------------------------------------
 
+# Host substrings -> service, checked in order (first hit wins)
+_SERVICE_HOSTS: Tuple[Tuple[Tuple[str, ...], str], ...] = (
+    (("outlook", "office365", "office", "live"), "outlook"),
+    (("sharepoint", "onedrive", "1drv"), "onedrive"),
+    (("drive.google",), "drive"),
+    (("efundi.nwu.ac.za",), "efundi"),  # No auth needed, assume
+)
+
+# Scrapers taking (page, month_bounds); Outlook is called directly for its extra options
+_SCRAPERS: Dict[str, Callable[[Any, Optional[object]], Any]] = {
+    "onedrive": scrape_onedrive,
+    "drive": scrape_drive,
+    "efundi": scrape_efundi,
+}
+
+
+def _service_for_host(host: str) -> Optional[str]:
+    """Map a hostname to the scraper service name, or ``None`` if unsupported."""
+    for tokens, service in _SERVICE_HOSTS:
+        if any(token in host for token in tokens):
+            return service
+    return None
+
+
 async def run_scan_active(
     url: str,
     on_progress: Optional[Callable] = None,
@@ -1675,6 +1913,7 @@ async def run_scan_active(
     identity: Optional[str] = None,
     *,
     deep_read: bool = True,
+    include_body: bool = True,
 ) -> List[Dict[str, Any]]:
     try:
         await ensure_browser()
@@ -1686,17 +1925,9 @@ async def run_scan_active(
     
     parsed_url = urlparse(url)
     host = parsed_url.hostname.lower() if parsed_url.hostname else ""
-    
-    if "outlook" in host or "office365" in host or "office" in host or "live" in host:
-        service = "outlook"
-    elif "sharepoint" in host or "onedrive" in host or "1drv" in host:
-        service = "onedrive"
-    elif "drive.google" in host:
-        service = "drive"
-    elif "efundi.nwu.ac.za" in host:
-        service = "efundi"  # No auth needed, assume
-    else:
-        service = None
+
+    service = _service_for_host(host)
+    if service is None:
         logger.warning(f"Unsupported host: {host}")
         return []
     
@@ -1729,15 +1960,12 @@ async def run_scan_active(
     if on_progress:
         await on_progress(30, "Loading content...")
 
-    items = []
     if service == "outlook":
-        items = await scrape_outlook(page, month_bounds, deep_read=deep_read, on_progress=on_progress)
-    elif service == "onedrive":
-        items = await scrape_onedrive(page, month_bounds)
-    elif service == "drive":
-        items = await scrape_drive(page, month_bounds)
-    elif service == "efundi":
-        items = await scrape_efundi(page, month_bounds)
+        items = await scrape_outlook(
+            page, month_bounds, deep_read=deep_read, include_body=include_body, on_progress=on_progress
+        )
+    else:
+        items = await _SCRAPERS[service](page, month_bounds)
 
     items = _expand_attachment_items(items)
 
@@ -1795,7 +2023,9 @@ _log_ocr_status_once()
 # SCAN_ACTIVE Wrapper for WebSocket integration
 # --------------------------------------------------------------------------------------
 
-async def run_scan_active_ws(email=None, year=None, month=None, url=None, deep_read=True, progress_callback=None):
+async def run_scan_active_ws(
+    email=None, year=None, month=None, url=None, deep_read=True, progress_callback=None, include_body=True
+):
     import datetime as dt
     from urllib.parse import urlparse
 
@@ -1819,10 +2049,16 @@ async def run_scan_active_ws(email=None, year=None, month=None, url=None, deep_r
     else:
         deep_read_flag = bool(deep_read)
 
+    if isinstance(include_body, str):
+        include_body_flag = include_body.strip().lower() in {"1", "true", "yes", "on"}
+    else:
+        include_body_flag = bool(include_body)
+
     return await run_scan_active(
         url=url,
         month_bounds=month_bounds,
         on_progress=progress_callback,
         identity=email,
         deep_read=deep_read_flag,
+        include_body=include_body_flag,
     )
@@ -3,6 +3,8 @@ from __future__ import annotations
 import re
 from typing import Dict, Iterable, List, Mapping, Optional
 
+_WORD_RE = re.compile(r"\b\w+\b")
+
 
 class EvidenceClassifier:
     """Deterministic keyword-based classifier for KPA routing."""
@@ -87,7 +89,7 @@ class EvidenceClassifier:
     def _tokenize(self, text: str) -> List[str]:
         if not text:
             return []
-        return re.findall(r"\b\w+\b", text.lower())
+        return _WORD_RE.findall(text.lower())
 
     def _top_kpa(self, scores: Mapping[str, float]) -> tuple[str, float]:
         sorted_scores = sorted(scores.items(), key=lambda kv: (-kv[1], kv[0]))